@@ -7,7 +7,6 @@ y procesamiento eficiente de datos.
 """
 
 import time
-import pandas as pd
 import os.path
 import sys
 import logging
@@ -15,10 +14,17 @@ import sqlite3
 import threading
 import re
 import json
+import importlib.util
+import multiprocessing
+import atexit
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import webbrowser
 import base64
 from io import BytesIO
+from urllib.parse import urlsplit, urlunsplit, urljoin, parse_qsl, urlencode
 
 # Intentar importar PIL, pero no fallar si no está disponible
 try:
@@ -34,7 +40,6 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
@@ -57,13 +62,19 @@ log_file = os.path.join(
     log_dir, f"extraccion_issues_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
 )
 
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+LOG_FORMATTER = logging.Formatter(LOG_FORMAT)  # Compartido por el handler de la interfaz
+
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
+    format=LOG_FORMAT,
     handlers=[logging.FileHandler(log_file), logging.StreamHandler()],
 )
 logger = logging.getLogger(__name__)
 
+# Escritorio del usuario de Windows (None si no hay perfil de usuario)
+DESKTOP_PATH = os.path.join(os.environ['USERPROFILE'], 'Desktop') if 'USERPROFILE' in os.environ else None
+
 # Colores estilo SAP
 SAP_COLORS = {
     "primary": "#1870C5",    # Azul SAP
@@ -78,6 +89,154 @@ SAP_COLORS = {
     "text": "#000000"        # Texto negro para máximo contraste
 }
 
+# Fuentes de la interfaz, compartidas por todos los widgets en lugar de crear una tupla por widget
+FONT_SMALL = ("Arial", 9)
+FONT_SMALL_BOLD = ("Arial", 9, "bold")
+FONT_BODY = ("Arial", 10)
+FONT_BODY_BOLD = ("Arial", 10, "bold")
+FONT_SECTION = ("Arial", 11, "bold")
+FONT_TITLE = ("Arial", 18, "bold")
+FONT_LOG = ("Consolas", 9)
+GUI_FONTS = (FONT_SMALL, FONT_SMALL_BOLD, FONT_BODY, FONT_BODY_BOLD, FONT_SECTION, FONT_TITLE, FONT_LOG)
+
+# Opciones comunes de los campos de entrada de la ventana principal
+ENTRY_OPTIONS = {
+    "width": 15,
+    "font": FONT_BODY,
+    "bg": "white",
+    "fg": "black",
+    "highlightbackground": SAP_COLORS["primary"],
+    "highlightcolor": SAP_COLORS["primary"],
+}
+
+# Botones de acción: estilo ttk -> (color de fondo, color al pasar el cursor)
+ACTION_BUTTON_COLORS = {
+    "Primary.TButton": (SAP_COLORS["primary"], "#0A3D6E"),
+    "Success.TButton": (SAP_COLORS["success"], "#085E2E"),
+    "Warning.TButton": (SAP_COLORS["warning"], "#C25A00"),
+    "Danger.TButton": (SAP_COLORS["danger"], "#990000"),
+}
+
+# Caché de expresiones XPath compiladas con lxml (selector -> etree.XPath)
+XPATH_CACHE = {}
+
+# Selectores XPath de la pestaña "Issues"
+ISSUES_TAB_SELECTORS = (
+    "//div[@role='tab' and contains(text(), 'Issues')]"
+    " | //a[contains(text(), 'Issues')]"
+    " | //li[contains(@class, 'tab') and contains(., 'Issues')]"
+    " | //div[contains(@class, 'sapMITBItem') and contains(., 'Issues')]"
+    " | //div[contains(@class, 'sapMITBItem')]//span[contains(text(), 'Issues')]/..",
+    "//*[contains(text(), 'Issues') and not(contains(text(), '('))]"
+)
+
+# Título "Issues (número)" y encabezados de columna de la tabla de issues
+ISSUES_TITLE_XPATH = "//div[contains(text(), 'Issues') and contains(text(), '(')]"
+ISSUES_COLUMN_HEADERS_XPATH = (
+    "//div[text()='Title'] | //div[text()='Type'] | //div[text()='Priority'] | //div[text()='Status']"
+)
+
+# Clases CSS de los indicadores de prioridad SAP y su etiqueta (en orden de precedencia)
+PRIORITY_CLASS_LABELS = {
+    "sapMGaugeNegativeColor": "Very High",
+    "sapMGaugeCriticalColor": "High",
+    "sapMGaugeNeutralColor": "Medium",
+    "sapMGaugePositiveColor": "Low",
+}
+
+# Color calculado (getComputedStyle) del indicador de prioridad en los temas SAP
+# Belize, Quartz (Fiori 3) y Horizon, que se mantiene aunque el tema cambie las clases
+PRIORITY_COLOR_LABELS = {
+    "rgb(187, 0, 0)": "Very High",     # Belize / Quartz Negative
+    "rgb(170, 8, 8)": "Very High",     # Horizon Negative
+    "rgb(231, 140, 7)": "High",        # Belize Critical
+    "rgb(233, 115, 12)": "High",       # Quartz Critical
+    "rgb(231, 101, 0)": "High",        # Horizon Critical
+    "rgb(94, 105, 110)": "Medium",     # Belize Neutral
+    "rgb(106, 109, 112)": "Medium",    # Quartz Neutral
+    "rgb(120, 143, 166)": "Medium",    # Horizon Neutral
+    "rgb(43, 124, 43)": "Low",         # Belize Positive
+    "rgb(16, 126, 62)": "Low",         # Quartz Positive
+    "rgb(37, 111, 58)": "Low",         # Horizon Positive
+}
+
+# Etiquetas de prioridad buscadas en el texto (de la más a la menos específica)
+PRIORITY_TEXT_LABELS = ("Very High", "High", "Medium", "Low")
+
+# Clases de indicador de prioridad como palabras completas, para buscarlas en el HTML de una fila
+PRIORITY_CLASS_PATTERN = re.compile(r"\b(" + "|".join(PRIORITY_CLASS_LABELS) + r")\b")
+
+# Todas las etiquetas de prioridad en una sola expresión, para recorrer cada texto una vez
+PRIORITY_TEXT_PATTERN = re.compile("|".join(re.escape(label) for label in PRIORITY_TEXT_LABELS))
+PRIORITY_TEXT_PATTERN_NOCASE = re.compile(PRIORITY_TEXT_PATTERN.pattern, re.IGNORECASE)
+
+# Reglas de normalización de estado en orden de precedencia: (palabras requeridas, estado estándar)
+STATUS_RULES = (
+    (("DONE",), "DONE"),
+    (("COMPLETED",), "DONE"),
+    (("OPEN",), "OPEN"),
+    (("IN PROGRESS",), "IN PROGRESS"),
+    (("PROCESSING",), "IN PROGRESS"),
+    (("READY", "PUBLISHING"), "READY FOR PUBLISHING"),
+    (("READY",), "READY"),
+    (("DRAFT",), "DRAFT"),
+    (("CLOSED",), "CLOSED"),
+    (("ACCEPTED",), "ACCEPTED"),
+)
+
+# Todas las palabras clave de estado en una sola expresión (sin distinguir mayúsculas,
+# para no tener que pasar cada texto a mayúsculas antes de buscar)
+STATUS_KEYWORDS = frozenset(keyword for keywords, _ in STATUS_RULES for keyword in keywords)
+STATUS_KEYWORD_PATTERN = re.compile("|".join(re.escape(keyword) for keyword in sorted(STATUS_KEYWORDS)), re.IGNORECASE)
+
+# Textos que ya son un estado conocido (en mayúsculas) y su valor estándar,
+# para resolver sin expresión regular el caso habitual de celda con el estado exacto
+STATUS_EXACT_MATCHES = {}
+for _keywords, _canonical in STATUS_RULES:
+    if len(_keywords) == 1:
+        STATUS_EXACT_MATCHES.setdefault(_keywords[0], _canonical)
+    STATUS_EXACT_MATCHES.setdefault(_canonical, _canonical)
+del _keywords, _canonical
+
+# Columnas del archivo Excel de issues, en el orden en que se escriben
+EXCEL_COLUMNS = (
+    "Title", "Type", "Priority", "Status", "Deadline", "Due Date",
+    "Created By", "Created On", "Last Updated", "Comments",
+)
+
+# Columnas de texto que se comparan como cadenas Arrow; el resto (fechas, comentarios)
+# conserva el tipo leído del Excel para escribirse igual que estaba
+EXCEL_TEXT_COLUMNS = ("Title", "Type", "Priority", "Status", "Created By")
+
+# Color de relleno de la columna Status en el Excel, por palabra clave y en orden de precedencia
+STATUS_FILL_COLORS = (
+    ("DONE", "CCFFCC"),
+    ("OPEN", "FFCCCC"),
+    ("READY", "FFFFCC"),
+    ("IN PROGRESS", "FFE6CC"),
+)
+
+# Nombres de campo (normalizados en minúsculas y sin separadores) aceptados
+# para cada columna al leer los issues desde respuestas OData/JSON
+ODATA_FIELD_ALIASES = {
+    "Title": ("title", "issuetitle", "shorttext"),
+    "Type": ("type", "issuetype", "category"),
+    "Priority": ("priority", "prioritytext", "prioritydescription"),
+    "Status": ("status", "statustext", "statusdescription", "lifecyclestatus"),
+    "Deadline": ("deadline",),
+    "Due Date": ("duedate", "due"),
+    "Created By": ("createdby", "creator", "createdbyname"),
+    "Created On": ("createdon", "createdat", "creationdate"),
+}
+
+# Un registro OData solo cuenta como issue si, además del título, trae al menos dos de
+# estas columnas: así se descartan listas de ayuda como tipos o estados de issue
+ODATA_ISSUE_EVIDENCE_COLUMNS = ("Status", "Priority", "Created By")
+ODATA_MIN_ISSUE_EVIDENCE = 2
+
+# Campos (normalizados) que identifican un registro OData cuando no trae __metadata.uri
+ODATA_KEY_FIELDS = ("id", "guid", "uuid", "issueid", "objectid")
+
 
 
 
@@ -87,9 +246,70 @@ SAP_COLORS = {
 
 
 
+# Sentencias SQL de DatabaseManager: las mismas cadenas en cada llamada reutilizan
+# las sentencias ya preparadas de la caché de la conexión
+SQL_GET_CLIENTS = "SELECT erp_number, name FROM clients ORDER BY last_used DESC"
+SQL_GET_PROJECTS = """
+    SELECT project_id, name
+    FROM projects
+    WHERE client_erp = ?
+    ORDER BY last_used DESC
+"""
+SQL_FIND_CLIENT = "SELECT * FROM clients WHERE erp_number = ?"
+SQL_UPDATE_CLIENT = """
+    UPDATE clients
+    SET name = ?, business_partner = ?, last_used = CURRENT_TIMESTAMP
+    WHERE erp_number = ?
+"""
+SQL_INSERT_CLIENT = """
+    INSERT INTO clients (erp_number, name, business_partner, last_used)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+"""
+SQL_FIND_PROJECT = "SELECT * FROM projects WHERE project_id = ?"
+SQL_UPDATE_PROJECT = """
+    UPDATE projects
+    SET client_erp = ?, name = ?, engagement_case = ?, last_used = CURRENT_TIMESTAMP
+    WHERE project_id = ?
+"""
+SQL_INSERT_PROJECT = """
+    INSERT INTO projects (project_id, client_erp, name, engagement_case, last_used)
+    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+SQL_UPSERT_CLIENT = """
+    INSERT INTO clients (erp_number, name, business_partner, last_used)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(erp_number) DO UPDATE SET
+        name = excluded.name,
+        business_partner = excluded.business_partner,
+        last_used = CURRENT_TIMESTAMP
+"""
+SQL_UPSERT_PROJECT = """
+    INSERT INTO projects (project_id, client_erp, name, engagement_case, last_used)
+    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(project_id) DO UPDATE SET
+        client_erp = excluded.client_erp,
+        name = excluded.name,
+        engagement_case = excluded.engagement_case,
+        last_used = CURRENT_TIMESTAMP
+"""
+SQL_UPDATE_CLIENT_USAGE = """
+    UPDATE clients
+    SET last_used = CURRENT_TIMESTAMP
+    WHERE erp_number = ?
+"""
+SQL_UPDATE_PROJECT_USAGE = """
+    UPDATE projects
+    SET last_used = CURRENT_TIMESTAMP
+    WHERE project_id = ?
+"""
+
+
 class DatabaseManager:
     """Clase dedicada al manejo de la base de datos de clientes y proyectos"""
     
+    # Máximo de entradas que se cargan en las listas desplegables (las de uso más reciente)
+    MAX_LIST_ITEMS = 500
+    
     def __init__(self, db_path=None):
         """Inicializa el administrador de base de datos"""
         if db_path is None:
@@ -99,69 +319,107 @@ class DatabaseManager:
             db_path = os.path.join(db_dir, "sap_extraction.db")
             
         self.db_path = db_path
+        
+        # Resultados de consultas de listas, invalidados al modificar las tablas
+        self._clients_cache = None
+        self._projects_cache = {}
+        
+        # Conexión única reutilizada por todas las consultas; el bloqueo la protege
+        # porque se usa tanto desde el hilo de Tk como desde hilos de trabajo
+        self._lock = threading.Lock()
+        self._conn = None
+        
         self.setup_database()
     
     def setup_database(self):
-        """Configura la estructura de la base de datos"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Crear tablas si no existen
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS clients (
-            erp_number TEXT PRIMARY KEY,
-            name TEXT,
-            business_partner TEXT,
-            last_used TIMESTAMP
-        )
-        ''')
-
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS projects (
-            project_id TEXT PRIMARY KEY,
-            client_erp TEXT,
-            name TEXT,
-            engagement_case TEXT,
-            last_used TIMESTAMP,
-            FOREIGN KEY (client_erp) REFERENCES clients(erp_number)
-        )
-        ''')
+        """Configura la conexión y la estructura de la base de datos"""
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        
+        # WAL y synchronous=NORMAL evitan un fsync completo por cada escritura
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-20000")
+        # Lecturas a través de mmap en lugar de copias read() a la caché de páginas
+        self._conn.execute("PRAGMA mmap_size=268435456")
         
-        conn.commit()
-        conn.close()
+        with self._lock:
+            conn = self._conn
+            cursor = conn.cursor()
+
+            # Crear tablas si no existen
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS clients (
+                erp_number TEXT PRIMARY KEY,
+                name TEXT,
+                business_partner TEXT,
+                last_used TIMESTAMP
+            )
+            ''')
+
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS projects (
+                project_id TEXT PRIMARY KEY,
+                client_erp TEXT,
+                name TEXT,
+                engagement_case TEXT,
+                last_used TIMESTAMP,
+                FOREIGN KEY (client_erp) REFERENCES clients(erp_number)
+            )
+            ''')
+            
+            # Índices de cobertura para las listas ordenadas por último uso: las consultas
+            # se resuelven recorriendo el índice, sin ordenar ni leer la tabla
+            cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_clients_last_used
+            ON clients (last_used DESC, erp_number, name)
+            ''')
+
+            cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_projects_client_last_used
+            ON projects (client_erp, last_used DESC, project_id, name)
+            ''')
+            
+            conn.commit()
+            
+            # Estadísticas para el planificador de consultas
+            cursor.execute("ANALYZE")
         
     def get_clients(self):
         """Obtiene la lista de clientes ordenados por último uso"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT erp_number, name FROM clients ORDER BY last_used DESC")
-        clients = cursor.fetchall()
+        # Consulta y caché bajo el mismo bloqueo que la invalidación: así una escritura
+        # concurrente no puede dejar guardado un resultado ya obsoleto
+        with self._lock:
+            if self._clients_cache is not None:
+                return self._clients_cache
+            if self._conn is None:
+                return ()
+            cursor = self._conn.cursor()
 
-        conn.close()
+            cursor.execute(SQL_GET_CLIENTS)
+            clients = cursor.fetchmany(self.MAX_LIST_ITEMS)
 
-        return [f"{erp} - {name}" for erp, name in clients]
+            self._clients_cache = tuple(f"{erp} - {name}" for erp, name in clients)
+            return self._clients_cache
     
     def get_projects(self, client_erp):
         """Obtiene la lista de proyectos para un cliente específico"""
         if not client_erp:
-            return []
+            return ()
             
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT project_id, name 
-            FROM projects 
-            WHERE client_erp = ? 
-            ORDER BY last_used DESC
-        """, (client_erp,))
+        with self._lock:
+            if client_erp in self._projects_cache:
+                return self._projects_cache[client_erp]
+            if self._conn is None:
+                return ()
+            cursor = self._conn.cursor()
 
-        projects = cursor.fetchall()
+            cursor.execute(SQL_GET_PROJECTS, (client_erp,))
 
-        conn.close()
+            projects = cursor.fetchmany(self.MAX_LIST_ITEMS)
 
-        return [f"{pid} - {name}" for pid, name in projects]
+            self._projects_cache[client_erp] = tuple(f"{pid} - {name}" for pid, name in projects)
+            return self._projects_cache[client_erp]
     
     def save_client(self, erp_number, name, business_partner=""):
         """Guarda o actualiza un cliente en la base de datos"""
@@ -169,35 +427,32 @@ class DatabaseManager:
             logger.error(f"Número ERP inválido: {erp_number}")
             return False
             
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                logger.warning("La base de datos ya está cerrada")
+                return False
+            cursor = conn.cursor()
 
-        try:
-            # Verificar si el cliente ya existe
-            cursor.execute("SELECT * FROM clients WHERE erp_number = ?", (erp_number,))
-            existing = cursor.fetchone()
-
-            if existing:
-                # Actualizar cliente existente
-                cursor.execute("""
-                    UPDATE clients 
-                    SET name = ?, business_partner = ?, last_used = CURRENT_TIMESTAMP 
-                    WHERE erp_number = ?
-                """, (name, business_partner, erp_number))
-            else:
-                # Insertar nuevo cliente
-                cursor.execute("""
-                    INSERT INTO clients (erp_number, name, business_partner, last_used) 
-                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                """, (erp_number, name, business_partner))
+            try:
+                # Verificar si el cliente ya existe
+                cursor.execute(SQL_FIND_CLIENT, (erp_number,))
+                existing = cursor.fetchone()
 
-            conn.commit()
-            return True
-        except Exception as e:
-            logger.error(f"Error al guardar cliente en BD: {e}")
-            return False
-        finally:
-            conn.close()
+                if existing:
+                    # Actualizar cliente existente
+                    cursor.execute(SQL_UPDATE_CLIENT, (name, business_partner, erp_number))
+                else:
+                    # Insertar nuevo cliente
+                    cursor.execute(SQL_INSERT_CLIENT, (erp_number, name, business_partner))
+
+                conn.commit()
+                self._clients_cache = None
+                return True
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Error al guardar cliente en BD: {e}")
+                return False
     
     def save_project(self, project_id, client_erp, name, engagement_case=""):
         """Guarda o actualiza un proyecto en la base de datos"""
@@ -205,91 +460,153 @@ class DatabaseManager:
             logger.error(f"ID de proyecto o cliente inválido: {project_id}, {client_erp}")
             return False
             
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                logger.warning("La base de datos ya está cerrada")
+                return False
+            cursor = conn.cursor()
 
-        try:
-            # Verificar si el proyecto ya existe
-            cursor.execute("SELECT * FROM projects WHERE project_id = ?", (project_id,))
-            existing = cursor.fetchone()
-
-            if existing:
-                # Actualizar proyecto existente
-                cursor.execute("""
-                    UPDATE projects 
-                    SET client_erp = ?, name = ?, engagement_case = ?, last_used = CURRENT_TIMESTAMP 
-                    WHERE project_id = ?
-                """, (client_erp, name, engagement_case, project_id))
-            else:
-                # Insertar nuevo proyecto
-                cursor.execute("""
-                    INSERT INTO projects (project_id, client_erp, name, engagement_case, last_used) 
-                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """, (project_id, client_erp, name, engagement_case))
+            try:
+                # Verificar si el proyecto ya existe
+                cursor.execute(SQL_FIND_PROJECT, (project_id,))
+                existing = cursor.fetchone()
 
-            conn.commit()
-            return True
-        except Exception as e:
-            logger.error(f"Error al guardar proyecto en BD: {e}")
+                if existing:
+                    # Actualizar proyecto existente
+                    cursor.execute(SQL_UPDATE_PROJECT, (client_erp, name, engagement_case, project_id))
+                else:
+                    # Insertar nuevo proyecto
+                    cursor.execute(SQL_INSERT_PROJECT, (project_id, client_erp, name, engagement_case))
+
+                conn.commit()
+                self._projects_cache.clear()
+                return True
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Error al guardar proyecto en BD: {e}")
+                return False
+    
+    def save_clients_bulk(self, clients):
+        """Guarda o actualiza varios clientes (erp, nombre, business partner) en una sola transacción"""
+        rows = [
+            (erp_number, name, business_partner)
+            for erp_number, name, business_partner in clients
+            if self.validate_input(erp_number, "erp")
+        ]
+        if len(rows) < len(clients):
+            logger.error(f"Se omitieron {len(clients) - len(rows)} clientes con número ERP inválido")
+        if not rows:
+            return False
+            
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                logger.warning("La base de datos ya está cerrada")
+                return False
+
+            try:
+                conn.executemany(SQL_UPSERT_CLIENT, rows)
+
+                conn.commit()
+                self._clients_cache = None
+                return True
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Error al guardar clientes en BD: {e}")
+                return False
+    
+    def save_projects_bulk(self, projects):
+        """Guarda o actualiza varios proyectos (id, cliente, nombre, engagement case) en una sola transacción"""
+        rows = [
+            (project_id, client_erp, name, engagement_case)
+            for project_id, client_erp, name, engagement_case in projects
+            if self.validate_input(project_id, "project") and self.validate_input(client_erp, "erp")
+        ]
+        if len(rows) < len(projects):
+            logger.error(f"Se omitieron {len(projects) - len(rows)} proyectos con ID de proyecto o cliente inválido")
+        if not rows:
             return False
-        finally:
-            conn.close()
+            
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                logger.warning("La base de datos ya está cerrada")
+                return False
+
+            try:
+                conn.executemany(SQL_UPSERT_PROJECT, rows)
+
+                conn.commit()
+                self._projects_cache.clear()
+                return True
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Error al guardar proyectos en BD: {e}")
+                return False
     
     def update_client_usage(self, erp_number):
         """Actualiza la fecha de último uso de un cliente"""
         if not self.validate_input(erp_number, "erp"):
             return False
             
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                logger.warning("La base de datos ya está cerrada")
+                return False
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute("""
-                UPDATE clients 
-                SET last_used = CURRENT_TIMESTAMP 
-                WHERE erp_number = ?
-            """, (erp_number,))
+            try:
+                cursor.execute(SQL_UPDATE_CLIENT_USAGE, (erp_number,))
             
-            conn.commit()
-            return True
-        except Exception as e:
-            logger.error(f"Error al actualizar uso de cliente: {e}")
-            return False
-        finally:
-            conn.close()
+                conn.commit()
+                self._clients_cache = None
+                return True
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Error al actualizar uso de cliente: {e}")
+                return False
     
     def update_project_usage(self, project_id):
         """Actualiza la fecha de último uso de un proyecto"""
         if not self.validate_input(project_id, "project"):
             return False
             
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                logger.warning("La base de datos ya está cerrada")
+                return False
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute("""
-                UPDATE projects 
-                SET last_used = CURRENT_TIMESTAMP 
-                WHERE project_id = ?
-            """, (project_id,))
+            try:
+                cursor.execute(SQL_UPDATE_PROJECT_USAGE, (project_id,))
             
-            conn.commit()
-            return True
-        except Exception as e:
-            logger.error(f"Error al actualizar uso de proyecto: {e}")
-            return False
-        finally:
-            conn.close()
+                conn.commit()
+                self._projects_cache.clear()
+                return True
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Error al actualizar uso de proyecto: {e}")
+                return False
+    
+    def close(self):
+        """Cierra la conexión con la base de datos"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
     
     @staticmethod
     def validate_input(input_str, input_type="general"):
         """Valida las entradas para prevenir inyecciones SQL"""
         if input_type == "erp":
-            # Solo permitir dígitos para ERP
-            return bool(re.match(r'^\d+$', str(input_str)))
+            # Solo permitir dígitos para ERP (isdecimal acepta los mismos dígitos que \d, sin regex)
+            return str(input_str).isdecimal()
         elif input_type == "project":
             # Solo permitir dígitos para ID de proyecto
-            return bool(re.match(r'^\d+$', str(input_str)))
+            return str(input_str).isdecimal()
         elif input_type == "path":
             # Validar ruta de archivo
             return os.path.isabs(input_str) and not any(c in input_str for c in '<>:|?*')
@@ -364,24 +681,8 @@ class ExcelManager:
     def _create_excel_template(self, file_path):
         """Crea la estructura del archivo Excel con las columnas necesarias"""
         try:
-            # Crear un DataFrame vacío con las columnas necesarias
-            columns = [
-                "Title",
-                "Type",
-                "Priority",
-                "Status",
-                "Deadline",
-                "Due Date",
-                "Created By",
-                "Created On",
-                "Last Updated",
-                "Comments",
-            ]
-
-            df = pd.DataFrame(columns=columns)
-
-            # Guardar el DataFrame vacío como un archivo Excel
-            df.to_excel(file_path, index=False)
+            # Solo la fila de encabezados: se escribe con openpyxl, sin cargar pandas
+            self._save_formatted_workbook(list(EXCEL_COLUMNS), [], file_path)
             logger.info(f"Archivo Excel creado exitosamente: {file_path}")
             return True
         except Exception as e:
@@ -394,11 +695,16 @@ class ExcelManager:
             logger.error("No hay ruta de archivo Excel especificada")
             return False
             
-        if not issues_data:
+        # len() en lugar de la veracidad directa: issues_data puede ser un DataFrame
+        if issues_data is None or len(issues_data) == 0:
             logger.warning("No hay datos para actualizar en Excel")
             return False
             
         try:
+            # Importación diferida: pandas solo se carga al trabajar con Excel
+            import numpy as np
+            import pandas as pd
+
             logger.info(f"Actualizando archivo Excel: {self.file_path}")
             
             # Cargar el archivo existente o crear estructura si no existe
@@ -408,78 +714,93 @@ class ExcelManager:
                     logger.info(f"Archivo Excel existente cargado con {len(existing_df)} registros")
                 except Exception as read_e:
                     logger.warning(f"Error al leer Excel: {read_e}. Creando estructura nueva.")
-                    existing_df = pd.DataFrame(
-                        columns=[
-                            "Title", "Type", "Priority", "Status", "Deadline", "Due Date",
-                            "Created By", "Created On", "Last Updated", "Comments"
-                        ]
-                    )
+                    existing_df = pd.DataFrame(columns=list(EXCEL_COLUMNS))
             else:
-                existing_df = pd.DataFrame(
-                    columns=[
-                        "Title", "Type", "Priority", "Status", "Deadline", "Due Date",
-                        "Created By", "Created On", "Last Updated", "Comments"
-                    ]
-                )
+                existing_df = pd.DataFrame(columns=list(EXCEL_COLUMNS))
                 logger.info("Creando nueva estructura de Excel")
 
-            # Convertir datos de issues a DataFrame
-            new_df = pd.DataFrame(issues_data)
+            # Convertir datos de issues a DataFrame (si ya lo es, se reutiliza)
+            if isinstance(issues_data, pd.DataFrame):
+                new_df = issues_data
+            else:
+                new_df = pd.DataFrame(issues_data)
+            
+            # Usar cadenas respaldadas por Arrow en las columnas de texto para reducir memoria
+            # y acelerar comparaciones, sin convertir números ni fechas introducidos por el usuario
+            existing_df = self._to_arrow_strings(existing_df, EXCEL_TEXT_COLUMNS)
+            new_df = self._to_arrow_strings(new_df, EXCEL_TEXT_COLUMNS)
             
             # Contadores para estadísticas
             new_items = 0
             updated_items = 0
             
-            # Hacer una copia del DataFrame existente para no modificarlo mientras iteramos
-            updated_df = existing_df.copy()
-            
-            # Optimización: crear índice para búsquedas rápidas si hay muchos registros
-            title_index = {}
-            if len(existing_df) > 0 and "Title" in existing_df.columns:
-                for idx, title in enumerate(existing_df["Title"]):
-                    if title not in title_index:
-                        title_index[title] = idx
-            
-            # Procesar cada issue nuevo
-            for _, new_row in new_df.iterrows():
-                title = new_row["Title"]
-                title_exists = title in title_index
-                
-                if not title_exists:
-                    # Agregar fecha de última actualización para elementos nuevos
-                    new_row_dict = new_row.to_dict()
-                    new_row_dict["Last Updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    new_row_df = pd.DataFrame([new_row_dict])
-                    updated_df = pd.concat([updated_df, new_row_df], ignore_index=True)
-                    new_items += 1
-                    logger.info(f"Nuevo issue añadido: '{title}'")
-                else:
-                    # Obtener índice del elemento existente
-                    idx = title_index[title]
+            # Marca de tiempo común a todas las filas nuevas o actualizadas en esta pasada
+            now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            
+            # Se actualiza el DataFrame existente directamente, por lo que no hace
+            # falta duplicar la hoja completa en memoria
+            updated_df = existing_df
+            
+            # Títulos nuevos (anti-join entre new_df y existing_df)
+            new_titles = self._find_new_titles(existing_df, new_df)
+            is_new = new_df["Title"].isin(new_titles).to_numpy(dtype=bool)
+            
+            # Actualizar los issues existentes: una sola unión por título y comparación por columnas
+            tracked_columns = ["Status", "Priority", "Type", "Due Date", "Deadline", "Created By", "Created On"]
+            compared_columns = [
+                column for column in tracked_columns
+                if column in existing_df.columns and column in new_df.columns
+            ]
+            if compared_columns and not is_new.all():
+                # Se compara con la primera aparición de cada título en el Excel, como hasta ahora
+                existing_first = existing_df.drop_duplicates("Title")[["Title"] + compared_columns]
+                merged = new_df.loc[~is_new, ["Title"] + compared_columns].merge(
+                    existing_first, on="Title", how="left", suffixes=("", "_old")
+                )
+                changed_any = np.zeros(len(merged), dtype=bool)
+                updated_titles = set()
+                
+                # Arrays de títulos obtenidos una sola vez, fuera del bucle por columna
+                merged_titles = merged["Title"].to_numpy()
+                sheet_titles = updated_df["Title"]
+                
+                for column in compared_columns:
+                    old_text = merged[column + "_old"].fillna("").astype(str)
+                    new_text = merged[column].fillna("").astype(str)
+                    changed = (old_text != new_text).to_numpy(dtype=bool)
+                    if not changed.any():
+                        continue
+                    changed_any |= changed
                     
-                    # Verificar cambios en el estado y otras columnas
-                    updated = False
+                    changed_titles = merged_titles[changed]
+                    for title, old_value, new_value in zip(changed_titles, old_text[changed], new_text[changed]):
+                        logger.info(f"Actualizado {column} de '{title}': '{old_value}' → '{new_value}'")
                     
-                    for column in ["Status", "Priority", "Type", "Due Date", "Deadline", "Created By", "Created On"]:
-                        if column in new_row and column in existing_df.columns:
-                            old_value = existing_df.iloc[idx][column] if not pd.isna(existing_df.iloc[idx][column]) else ""
-                            new_value = new_row[column] if not pd.isna(new_row[column]) else ""
-                            
-                            if str(old_value) != str(new_value):
-                                mask = updated_df["Title"] == title
-                                updated_df.loc[mask, column] = new_value
-                                updated_df.loc[mask, "Last Updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                                updated = True
-                                logger.info(f"Actualizado {column} de '{title}': '{old_value}' → '{new_value}'")
+                    # Si un título aparece varias veces en los datos nuevos, prevalece el último valor
+                    new_by_title = pd.Series(merged[column].to_numpy()[changed], index=changed_titles)
+                    new_by_title = new_by_title[~new_by_title.index.duplicated(keep="last")]
+                    mask = sheet_titles.isin(new_by_title.index)
+                    updated_df.loc[mask, column] = sheet_titles[mask].map(new_by_title)
+                    updated_titles.update(new_by_title.index)
                     
-                    if updated:
-                        updated_items += 1
+                if updated_titles:
+                    updated_df.loc[sheet_titles.isin(updated_titles), "Last Updated"] = now_str
+                updated_items = int(changed_any.sum())
             
-            # Guardar el DataFrame actualizado
-            updated_df.to_excel(self.file_path, index=False, engine='openpyxl')
+            # Agregar los issues nuevos con una sola concatenación en lugar de una por fila
+            if is_new.any():
+                new_rows = new_df.loc[is_new].copy()
+                
+                # Agregar fecha de última actualización para elementos nuevos
+                new_rows["Last Updated"] = now_str
+                for title in new_rows["Title"]:
+                    logger.info(f"Nuevo issue añadido: '{title}'")
+                    
+                updated_df = pd.concat([updated_df, new_rows], ignore_index=True)
+                new_items = len(new_rows)
             
-            # Aplicar formato al Excel
-            self._apply_excel_formatting()
+            # Guardar el DataFrame actualizado, ya con formato
+            self._write_formatted_excel(updated_df)
             
             logger.info(f"Excel actualizado: {new_items} nuevos, {updated_items} actualizados")
             return True, new_items, updated_items
@@ -488,91 +809,144 @@ class ExcelManager:
             logger.error(f"Error al actualizar el archivo Excel: {e}")
             return False, 0, 0
             
-    def _apply_excel_formatting(self):
-        """Aplica formato estético al archivo Excel"""
+    @staticmethod
+    def _to_arrow_strings(df, columns):
+        """Convierte las columnas indicadas a cadenas Arrow si pyarrow está disponible"""
+        dtypes = {column: "string[pyarrow]" for column in columns if column in df.columns}
         try:
-            from openpyxl import load_workbook
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-
-            wb = load_workbook(self.file_path)
-            ws = wb.active
+            return df.astype(dtypes)
+        except ImportError:
+            # Sin pyarrow se mantienen los tipos object de pandas
+            return df
             
-            # Formato para encabezados
-            header_fill = PatternFill(
-                start_color="1F4E78", end_color="1F4E78", fill_type="solid"
-            )
-            header_font = Font(bold=True, color="FFFFFF")
-            header_alignment = Alignment(horizontal="center", vertical="center")
-
-            thin_border = Border(
-                left=Side(style="thin"),
-                right=Side(style="thin"),
-                top=Side(style="thin"),
-                bottom=Side(style="thin"),
-            )
-
-            # Aplicar formato a encabezados
-            for col in range(1, ws.max_column + 1):
-                cell = ws.cell(row=1, column=col)
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = header_alignment
-                cell.border = thin_border
-
-            # Aplicar formato a celdas de datos
-            for row in range(2, ws.max_row + 1):
-                for col in range(1, ws.max_column + 1):
-                    cell = ws.cell(row=row, column=col)
-                    cell.border = thin_border
-
-                    # Colorear por estado
-                    if col == 4:  # Columna Status
-                        status = str(cell.value).upper() if cell.value else ""
-
-                        if "DONE" in status:
-                            cell.fill = PatternFill(
-                                start_color="CCFFCC",
-                                end_color="CCFFCC",
-                                fill_type="solid",
-                            )
-                        elif "OPEN" in status:
-                            cell.fill = PatternFill(
-                                start_color="FFCCCC",
-                                end_color="FFCCCC",
-                                fill_type="solid",
-                            )
-                        elif "READY" in status:
-                            cell.fill = PatternFill(
-                                start_color="FFFFCC",
-                                end_color="FFFFCC",
-                                fill_type="solid",
-                            )
-                        elif "IN PROGRESS" in status:
-                            cell.fill = PatternFill(
-                                start_color="FFE6CC",
-                                end_color="FFE6CC",
-                                fill_type="solid",
-                            )
-
-            # Ajustar ancho de columnas
-            for col in range(1, ws.max_column + 1):
-                max_length = 0
-                for row in range(1, ws.max_row + 1):
-                    cell_value = ws.cell(row=row, column=col).value
-                    if cell_value:
-                        max_length = max(max_length, len(str(cell_value)))
-
-                adjusted_width = max(10, min(50, max_length + 2))
-                ws.column_dimensions[
-                    ws.cell(row=1, column=col).column_letter
-                ].width = adjusted_width
-
-            wb.save(self.file_path)
+    def _find_new_titles(self, existing_df, new_df):
+        """Obtiene los títulos de new_df que no existen en existing_df"""
+        if len(existing_df) == 0 or "Title" not in existing_df.columns:
+            return set(new_df["Title"])
+            
+        try:
+            # DuckDB es opcional: resuelve el anti-join sin intermedios de pandas
+            import duckdb
+        except ImportError:
+            duckdb = None
+            
+        if duckdb is not None:
+            try:
+                con = duckdb.connect()
+                try:
+                    con.register("ex", existing_df[["Title"]])
+                    con.register("nw", new_df[["Title"]])
+                    rows = con.execute(
+                        "SELECT DISTINCT nw.Title FROM nw ANTI JOIN ex USING (Title)"
+                    ).fetchall()
+                finally:
+                    con.close()
+                return {row[0] for row in rows}
+            except Exception as e:
+                logger.debug(f"Error en anti-join con DuckDB, usando pandas: {e}")
+        
+        # Alternativa con pandas si DuckDB no está disponible
+        missing_mask = ~new_df["Title"].isin(existing_df["Title"])
+        return set(new_df.loc[missing_mask, "Title"])
+            
+    def _write_formatted_excel(self, df, file_path=None):
+        """Escribe el DataFrame en el archivo Excel con el formato aplicado en la misma pasada"""
+        file_path = file_path or self.file_path
+        try:
+            # Valores sin NaN/NA (celdas vacías), como los escribía to_excel
+            headers = [str(column) for column in df.columns]
+            rows = df.astype(object).where(df.notna(), None).values.tolist()
+            
+            self._save_formatted_workbook(headers, rows, file_path)
             logger.info("Formato aplicado al archivo Excel correctamente")
             return True
         except Exception as format_e:
+            # Si falla la escritura con formato, guardar al menos los datos
             logger.warning(f"No se pudo aplicar formato al Excel: {format_e}")
+            df.to_excel(file_path, index=False, engine='openpyxl')
             return False
+            
+    def _save_formatted_workbook(self, headers, rows, file_path):
+        """Guarda encabezados y filas en un libro nuevo, con formato, usando solo openpyxl"""
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+        from openpyxl.utils import get_column_letter
+
+        # Libro de solo escritura: las filas se vuelcan con su estilo sin volver a leer el archivo
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        
+        # Formato para encabezados
+        header_fill = PatternFill(
+            start_color="1F4E78", end_color="1F4E78", fill_type="solid"
+        )
+        header_font = Font(bold=True, color="FFFFFF")
+        header_alignment = Alignment(horizontal="center", vertical="center")
+
+        thin_border = Border(
+            left=Side(style="thin"),
+            right=Side(style="thin"),
+            top=Side(style="thin"),
+            bottom=Side(style="thin"),
+        )
+
+        # Rellenos de estado creados una sola vez y compartidos por todas las celdas
+        status_fills = [
+            (keyword, PatternFill(start_color=color, end_color=color, fill_type="solid"))
+            for keyword, color in STATUS_FILL_COLORS
+        ]
+        # Relleno por texto de estado: búsqueda directa y subcadenas solo la primera vez
+        fill_by_status = dict(status_fills)
+
+        # Ajustar ancho de columnas: en modo solo escritura debe fijarse antes de añadir filas
+        max_lengths = [len(header) for header in headers]
+        for row_values in rows:
+            for col_index, cell_value in enumerate(row_values):
+                if cell_value:
+                    length = len(str(cell_value))
+                    if length > max_lengths[col_index]:
+                        max_lengths[col_index] = length
+
+        for col_index, max_length in enumerate(max_lengths):
+            adjusted_width = max(10, min(50, max_length + 2))
+            ws.column_dimensions[get_column_letter(col_index + 1)].width = adjusted_width
+
+        # Aplicar formato a encabezados
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.fill = header_fill
+            cell.font = header_font
+            cell.alignment = header_alignment
+            cell.border = thin_border
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        # Aplicar formato a celdas de datos
+        for row_values in rows:
+            row_cells = []
+            for cell_value in row_values:
+                cell = WriteOnlyCell(ws, value=cell_value)
+                cell.border = thin_border
+                row_cells.append(cell)
+
+            # Colorear por estado (columna 4, Status)
+            if len(row_cells) >= 4 and row_values[3]:
+                status = str(row_values[3]).upper()
+                try:
+                    fill = fill_by_status[status]
+                except KeyError:
+                    fill = next(
+                        (keyword_fill for keyword, keyword_fill in status_fills if keyword in status),
+                        None,
+                    )
+                    fill_by_status[status] = fill
+                if fill is not None:
+                    row_cells[3].fill = fill
+            ws.append(row_cells)
+
+        wb.save(file_path)
         
         
         
@@ -587,28 +961,389 @@ class ExcelManager:
         
         
         
+# Script que extrae los campos de una lista de filas (arguments[0]) en el navegador.
+# Se comparte entre Selenium (execute_script) y Playwright (page.evaluate)
+BULK_ROWS_SCRIPT = """
+    var rows = arguments[0];
+    var colorLabels = arguments[1];
+    
+    function textOf(el) {
+        return el ? (el.innerText || "").trim() : "";
+    }
+    
+    function ownText(el) {
+        var text = "";
+        for (var node = el.firstChild; node; node = node.nextSibling) {
+            if (node.nodeType === 3) text += node.nodeValue;
+        }
+        return text;
+    }
+    
+    function getCells(row) {
+        var strategies = ["td", "div[role='gridcell']", ":scope > div",
+                          "[class*='cell'], [class*='Cell']", "span[id*='col']"];
+        for (var i = 0; i < strategies.length; i++) {
+            var found = row.querySelectorAll(strategies[i]);
+            if (found.length > 1) return found;
+        }
+        return [];
+    }
+    
+    function getTitle(row) {
+        var textSelectors = ["a", "span[class*='title']", "div[class*='title']",
+                             "div[role='gridcell']", "td", "[id*='title']"];
+        for (var i = 0; i < textSelectors.length; i++) {
+            var value = textOf(row.querySelector(textSelectors[i]));
+            if (value) return value;
+        }
+        var attrSelectors = ["div[title]", "span[title]"];
+        for (var j = 0; j < attrSelectors.length; j++) {
+            var el = row.querySelector(attrSelectors[j]);
+            var attr = el ? (el.getAttribute("title") || "").trim() : "";
+            if (attr) return attr;
+        }
+        var firstLine = textOf(row).split("\\n")[0].trim();
+        if (!firstLine) return null;
+        return firstLine.length > 100 ? firstLine.substring(0, 100) + "..." : firstLine;
+    }
+    
+    function getType(row, cells) {
+        if (cells.length >= 2) {
+            var text = textOf(cells[1]);
+            if (text) return text;
+        }
+        var attrs = ["data-type", "title", "aria-label"];
+        for (var i = 0; i < attrs.length; i++) {
+            var value = row.getAttribute(attrs[i]);
+            if (value && value.toLowerCase().indexOf("type") !== -1) return value.trim();
+        }
+        return cells.length >= 2 ? "" : null;
+    }
+    
+    function getPriority(row, cells) {
+        if (cells.length >= 3) {
+            var text = textOf(cells[2]);
+            if (text) return text;
+        }
+        var gauge = row.querySelector("[class*='sapMGauge'][class*='Color']");
+        if (gauge) {
+            var color = getComputedStyle(gauge).color;
+            if (colorLabels.hasOwnProperty(color)) return colorLabels[color];
+        }
+        var classes = [["sapMGaugeNegativeColor", "Very High"], ["sapMGaugeCriticalColor", "High"],
+                       ["sapMGaugeNeutralColor", "Medium"], ["sapMGaugePositiveColor", "Low"]];
+        for (var i = 0; i < classes.length; i++) {
+            if (row.querySelector("span[class*='" + classes[i][0] + "']")) return classes[i][1];
+        }
+        var labels = ["Very High", "High", "Medium", "Low"];
+        var spans = row.querySelectorAll("span");
+        for (var j = 0; j < labels.length; j++) {
+            for (var k = 0; k < spans.length; k++) {
+                if (ownText(spans[k]).indexOf(labels[j]) !== -1) return labels[j];
+            }
+        }
+        return "";
+    }
+    
+    function getStatus(cells) {
+        if (cells.length < 4) return null;
+        var text = textOf(cells[3]);
+        if (!text) return "";
+        var status = text.split("\\n")[0].trim();
+        status = status.split("Object Status").join("").trim();
+        return status.split("Entry successfully validated").join("").trim();
+    }
+    
+    function cellText(cells, position) {
+        return cells.length > position ? textOf(cells[position]) : null;
+    }
+    
+    return rows.map(function(row) {
+        var cells = getCells(row);
+        return {
+            "Title": getTitle(row),
+            "Type": getType(row, cells),
+            "Priority": getPriority(row, cells),
+            "Status": getStatus(cells),
+            "Deadline": cellText(cells, 4),
+            "Due Date": cellText(cells, 5),
+            "Created By": cellText(cells, 6),
+            "Created On": cellText(cells, 7)
+        };
+    });
+"""
+
+
+# Función que localiza las filas de la página con un XPath, descarta encabezados y filas
+# vacías (igual que _filter_valid_rows) y extrae sus campos con BULK_ROWS_SCRIPT
+PAGE_ROWS_FUNCTION = """function(rowXPath, colorLabels) {
+    var snapshot = document.evaluate(rowXPath, document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var rows = [];
+    for (var i = 0; i < snapshot.snapshotLength; i++) {
+        var row = snapshot.snapshotItem(i);
+        if (/header/i.test(row.getAttribute("class") || "")) continue;
+        if (!(row.innerText || "").trim()) continue;
+        rows.push(row);
+    }
+    return (function() {""" + BULK_ROWS_SCRIPT + """}).apply(null, [rows, colorLabels]);
+}"""
+
+
+# Evalúa una lista de selectores (arguments[0]) en orden y devuelve [índice, elementos] del
+# primero que encuentra algo, o null: una sola llamada al navegador en lugar de una por selector.
+# Los que empiezan por "/" son XPath; el resto, selectores CSS (querySelectorAll es más rápido)
+FIRST_SELECTOR_MATCH_SCRIPT = """
+    var selectors = arguments[0];
+    for (var i = 0; i < selectors.length; i++) {
+        var elements = [];
+        if (selectors[i].charAt(0) === "/") {
+            var snapshot = document.evaluate(selectors[i], document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var j = 0; j < snapshot.snapshotLength; j++) {
+                elements.push(snapshot.snapshotItem(j));
+            }
+        } else {
+            elements = Array.prototype.slice.call(document.querySelectorAll(selectors[i]));
+        }
+        if (elements.length) {
+            return [i, elements];
+        }
+    }
+    return null;
+"""
+
+
+# Descarga una URL (arguments[0]) desde la página con las cookies de la sesión y devuelve
+# el cuerpo como texto; execute_script espera a que la promesa se resuelva
+ODATA_FETCH_SCRIPT = """
+    return fetch(arguments[0], {credentials: 'include', headers: {'Accept': 'application/json'}})
+        .then(function(response) { return response.text(); });
+"""
+
+
+# Número de nodos de cada XPath de arguments[0] en el DOM actual (null si no es válido)
+XPATH_COUNTS_SCRIPT = """
+    return arguments[0].map(function(selector) {
+        try {
+            return document.evaluate("count(" + selector + ")", document, null,
+                XPathResult.NUMBER_TYPE, null).numberValue;
+        } catch (e) {
+            return null;
+        }
+    });
+"""
+
+
 class SAPBrowser:
     """Clase para la automatización del navegador y extracción de datos de SAP"""
     
-    def __init__(self):
-        """Inicializa el controlador del navegador"""
-        self.driver = None
-        self.wait = None
-        self.element_cache = {}  # Caché para elementos encontrados frecuentemente
+    # Selectores XPath de filas de la tabla en SAP UI5
+    ROW_SELECTORS = (
+        # Selectores de SAP estándar
+        "//table[contains(@class, 'sapMListTbl')]/tbody/tr[not(contains(@class, 'sapMListTblHeader'))]",
+        "//div[contains(@class, 'sapMList')]//li[contains(@class, 'sapMLIB')]",
+        "//table[contains(@class, 'sapMList')]/tbody/tr",
+        "//div[@role='row'][not(contains(@class, 'sapMListHeaderSubTitleItems')) and not(contains(@class, 'sapMListTblHeader'))]",
+        "//div[contains(@class, 'sapMListItems')]/div[contains(@class, 'sapMListItem')]",
+        "//div[contains(@class, 'sapMListItems')]//div[contains(@class, 'sapMObjectIdentifier')]/..",
+        "//div[contains(@class, 'sapMListItem')]",
         
-    def connect(self):
-        """Inicia una sesión de navegador con perfil dedicado"""
-        logger.info("Iniciando navegador con perfil guardado...")
+        # Selectores de Fiori
+        "//div[contains(@class, 'sapMList')]//li[@tabindex]",
+        "//div[contains(@class, 'sapUiTable')]//tr[contains(@class, 'sapUiTableRow')]",
+        "//div[contains(@class, 'sapUiTableRowHdr')]/..",
+        "//table[contains(@class, 'sapMTable')]//tr[not(contains(@class, 'sapMListTblHeaderRow'))]",
         
-        try:
-            # Ruta al directorio del perfil
-            user_data_dir = os.path.join(os.environ['USERPROFILE'], 'AppData', 'Local', 'Google', 'Chrome', 'SAP_Automation')
-            
-            # Crear directorio si no existe
-            if not os.path.exists(user_data_dir):
-                os.makedirs(user_data_dir)
-                logger.info(f"Creado directorio de perfil: {user_data_dir}")
-            
+        # Selectores específicos de SDWork Center
+        "//div[contains(@class, 'sdworkItems')]//div[contains(@class, 'sapMLIB')]",
+        "//div[contains(@class, 'issueList')]//div[contains(@class, 'sapMLIB')]",
+        "//div[contains(@id, 'issue')]//div[contains(@class, 'sapMLIB')]",
+        
+        # Selectores genéricos más específicos
+        "//div[contains(@class, 'sapMLIB-CTX')]",
+        "//div[contains(@class, 'sapMObjectListItem')]",
+        "//div[contains(@class, 'sapMListModeMultiSelect')]//div[contains(@class, 'sapMLIB')]"
+    )
+    
+    # Selectores de controles de paginación: CSS cuando basta con clases o atributos,
+    # XPath (empiezan por "/") cuando hay que comparar el texto
+    PAGINATION_SELECTORS = (
+        "div[class*='sapMPaginator']",
+        "div[class*='sapUiTablePaginator']",
+        "div[class*='pagination']",
+        "button[class*='navButton'], button[aria-label*='Next'], button[aria-label*='Siguiente']",
+        "span[class*='sapMPaginatorButton']",
+        "//button[contains(text(), 'Next') or contains(text(), 'Siguiente')]",
+        "a[class*='sapMBtn'][aria-label*='Next']"
+    )
+    
+    # Selectores de botones "Show More" / "Load More" (CSS o XPath, como los de paginación)
+    LOAD_MORE_SELECTORS = (
+        "//button[contains(text(), 'More') or contains(text(), 'más') or contains(text(), 'Show')]",
+        "//a[contains(text(), 'More') or contains(text(), 'Load')]",
+        "div[class*='sapMListShowMoreButton']",
+        "//span[contains(text(), 'Show') and contains(text(), 'More')]/..",
+        "span[class*='sapUiTableColShowMoreButton']"
+    )
+    
+    # Botones "Show More" que se pulsan durante el scroll, unidos en un solo XPath
+    SHOW_MORE_XPATH = (
+        "//button[contains(text(), 'More')]"
+        " | //button[contains(text(), 'más')]"
+        " | //a[contains(text(), 'More')]"
+        " | //div[contains(@class, 'sapMListShowMoreButton')]"
+    )
+    
+    # Selectores CSS de celdas dentro de una fila, en orden de prioridad: td de tabla HTML,
+    # gridcell de SAP UI5, divs hijos directos, clases de celda y spans de columna
+    CELL_SELECTORS = (
+        "td",
+        "div[role='gridcell']",
+        ":scope > div",
+        "[class*='cell'], [class*='Cell']",
+        "span[id*='col']",
+    )
+    
+    # Los mismos selectores de celdas en XPath, para analizar el HTML de la fila con lxml
+    CELL_XPATHS = (
+        ".//td",
+        ".//div[@role='gridcell']",
+        "./div",
+        ".//*[contains(@class, 'cell') or contains(@class, 'Cell')]",
+        ".//span[contains(@id, 'col')]",
+    )
+    
+    # Busca controles UI5 por tipo y propiedades y devuelve sus elementos DOM
+    UI5_CONTROLS_SCRIPT = """
+    function findUI5Controls(controlType, properties) {
+        if (!window.sap || !window.sap.ui) return [];
+        
+        var controls = sap.ui.getCore().byFieldGroupId().filter(function(control) {
+            return control.getMetadata().getName() === controlType;
+        });
+        
+        if (properties) {
+            controls = controls.filter(function(control) {
+                for (var prop in properties) {
+                    if (control.getProperty(prop) !== properties[prop]) {
+                        return false;
+                    }
+                }
+                return true;
+            });
+        }
+        
+        return controls.map(function(control) {
+            return control.getId();
+        });
+    }
+    return findUI5Controls(arguments[0], arguments[1]).map(function(id) {
+        return document.getElementById(id);
+    }).filter(function(element) {
+        return element !== null;
+    });
+    """
+    
+    # Selectores de título en orden de prioridad: (XPath relativo a la fila, atributo o None para el texto)
+    TITLE_XPATHS = (
+        (".//a", None),
+        (".//span[contains(@class, 'title')]", None),
+        (".//div[contains(@class, 'title')]", None),
+        (".//div[@role='gridcell']", None),
+        (".//td", None),
+        (".//*[contains(@id, 'title')]", None),
+        (".//div[@title]", "title"),
+        (".//span[@title]", "title"),
+    )
+    
+    # Descarga paralela de páginas OData con varios navegadores headless.
+    # Desactivada por defecto: requiere haber detectado la URL OData de issues
+    PARALLEL_PAGINATION = False
+    
+    # Número máximo de entradas en la caché de elementos y su vigencia en segundos
+    ELEMENT_CACHE_MAX_SIZE = 32
+    ELEMENT_CACHE_TTL = 5.0
+    
+    # Extracción de filas en paralelo con hilos. Desactivada por defecto: con
+    # ChromeDriver local la latencia por llamada es baja y no compensa
+    THREADED_ROW_EXTRACTION = False
+    ROW_EXTRACTION_WORKERS = 8
+    
+    # Extracción de la tabla con Playwright conectado por CDP al mismo Chrome.
+    # Desactivada por defecto; si Playwright no está instalado se usa Selenium
+    USE_PLAYWRIGHT = False
+    
+    # Segundos mínimos de espera antes de aceptar que UI5 inactivo significa que no hay más filas
+    ROW_WAIT_MIN_IDLE = 1.0
+    
+    # Archivo con las estadísticas de acierto de los selectores de filas
+    SELECTOR_STATS_PATH = os.path.join("config", "selector_stats.json")
+    
+    # Botón OK del diálogo de certificado y comprobación de que el launchpad ya cargó
+    CERTIFICATE_OK_XPATH = "//button[contains(text(), 'OK') or contains(text(), 'Ok')]"
+    # Ambas comprobaciones se hacen en una sola llamada: devuelve el primer botón OK visible
+    # y habilitado (arguments[0] es su XPath), true si el launchpad ya cargó o false si aún no
+    CERTIFICATE_OR_LAUNCHPAD_SCRIPT = """
+        var snapshot = document.evaluate(arguments[0], document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var i = 0; i < snapshot.snapshotLength; i++) {
+            var button = snapshot.snapshotItem(i);
+            if (!button.disabled && button.getClientRects().length
+                    && getComputedStyle(button).visibility !== 'hidden') {
+                return button;
+            }
+        }
+        return document.readyState === 'complete'
+            && !!document.querySelector('#shell-container, .sapUshellShell, #canvas');
+    """
+    
+    # Documento cargado y UI5 (si está presente) sin renderizado pendiente ni indicadores de carga
+    UI_READY_SCRIPT = """
+        if (document.readyState !== 'complete') return false;
+        if (window.sap && sap.ui && sap.ui.getCore) {
+            return !sap.ui.getCore().getUIDirty() &&
+                !document.querySelector('.sapUiLocalBusyIndicator, .sapUiBusyIndicator');
+        }
+        return true;
+    """
+    
+    # Perfil de Chrome por defecto. Chrome bloquea el directorio de perfil, así que otro
+    # navegador abierto a la vez necesita su propio nombre de perfil (profile_name)
+    PROFILE_NAME = "SAP_Automation"
+    
+    def __init__(self, profile_name=None):
+        """Inicializa el controlador del navegador"""
+        self.profile_name = profile_name or self.PROFILE_NAME
+        self.driver = None
+        self.wait = None
+        self.element_cache = OrderedDict()  # Caché LRU para elementos encontrados frecuentemente
+        self._last_row_selector = None  # Último selector XPath que encontró filas
+        self._odata_issues_url = None  # URL OData de issues detectada en el tráfico de red
+        self._next_button_xpath = None  # XPath del botón "Next" usado en la extracción actual
+        # Veces que cada selector de filas fue el elegido, por página y entre ejecuciones
+        self._selector_stats = self._load_selector_stats()
+        self._selector_stats_changed = False
+        atexit.register(self._save_selector_stats)
+        self._row_texts_cache = {}  # Textos de celdas por fila (id del WebElement)
+        self._row_cell_cache = {}  # Celdas (WebElements) por fila (id del WebElement)
+        self._row_cache_lock = threading.Lock()  # Protege las cachés por fila en la extracción con hilos
+        self._playwright = None  # Instancia de Playwright (opcional)
+        self._playwright_page = None  # Página de Playwright conectada al Chrome de Selenium
+        
+    def connect(self, headless=False):
+        """Inicia una sesión de navegador con perfil dedicado (sin ventana ni imágenes si headless)"""
+        logger.info("Iniciando navegador con perfil guardado...")
+        
+        try:
+            # Ruta al directorio del perfil
+            user_data_dir = os.path.join(os.environ['USERPROFILE'], 'AppData', 'Local', 'Google', 'Chrome', self.profile_name)
+            
+            # Crear directorio si no existe
+            if not os.path.exists(user_data_dir):
+                os.makedirs(user_data_dir)
+                logger.info(f"Creado directorio de perfil: {user_data_dir}")
+            
             # Configurar opciones de Chrome
             chrome_options = Options()
             chrome_options.add_argument("--start-maximized")
@@ -628,13 +1363,31 @@ class SAPBrowser:
             chrome_options.add_argument("--js-flags=--expose-gc")
             chrome_options.add_argument("--enable-precise-memory-info")
             
+            # Modo sin ventana: no se descargan ni decodifican imágenes. El modo visible se mantiene
+            # por defecto porque el usuario inicia sesión y elige cliente y proyecto a mano
+            if headless:
+                chrome_options.add_argument("--headless=new")
+                chrome_options.add_argument("--window-size=1920,1080")
+                chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+                chrome_options.add_experimental_option(
+                    "prefs", {"profile.managed_default_content_settings.images": 2}
+                )
+            
             # Agregar opciones para permitir que el usuario use el navegador mientras se ejecuta el script
             chrome_options.add_experimental_option("detach", True)
             
+            # Registrar eventos de red para poder leer las respuestas OData de issues
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            
             # Intentar iniciar el navegador
             self.driver = webdriver.Chrome(options=chrome_options)
             self.wait = WebDriverWait(self.driver, 60)  # Timeout de 60 segundos
             
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+            except Exception as cdp_e:
+                logger.debug(f"No se pudo habilitar el dominio Network de CDP: {cdp_e}")
+            
             logger.info("Navegador Chrome iniciado correctamente")
             return True
             
@@ -666,18 +1419,27 @@ class SAPBrowser:
         try:
             # Actualizar URL a la nueva URL proporcionada
             self.driver.get("https://xalm-prod.x.eu20.alm.cloud.sap/launchpad#sdwork-center&/projects")
+            self._invalidate_caches()
             logger.info("Navegando a URL de SAP actualizada...")
             
-            # Esperar a que cargue la página
-            time.sleep(5)
-            
-            # Intentar aceptar certificados si aparece el diálogo
+            # Esperar a que cargue la página: termina en cuanto el documento está completo,
+            # con el mismo máximo de 5 segundos que la pausa fija anterior
             try:
-                ok_button = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'OK') or contains(text(), 'Ok')]"))
+                WebDriverWait(self.driver, 5).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
                 )
-                ok_button.click()
-                logger.info("Se hizo clic en el botón OK del certificado")
+            except TimeoutException:
+                logger.debug("La página de SAP no terminó de cargar en 5 segundos, se continúa")
+            
+            # Intentar aceptar certificados si aparece el diálogo. La misma espera termina
+            # en cuanto el launchpad está cargado, sin agotar el tiempo cuando no hay diálogo
+            try:
+                ok_button = WebDriverWait(self.driver, 10).until(self._certificate_button_or_launchpad)
+                if ok_button is True:
+                    logger.info("No se encontró diálogo de certificado o ya fue aceptado")
+                else:
+                    ok_button.click()
+                    logger.info("Se hizo clic en el botón OK del certificado")
             except TimeoutException:
                 logger.info("No se encontró diálogo de certificado o ya fue aceptado")
                 
@@ -687,14 +1449,16 @@ class SAPBrowser:
             logger.error(f"Error al navegar a SAP: {e}")
             return False
     
+    def _certificate_button_or_launchpad(self, driver):
+        """Condición de espera: el botón OK del certificado si aparece, o True si el launchpad ya cargó"""
+        return driver.execute_script(self.CERTIFICATE_OR_LAUNCHPAD_SCRIPT, self.CERTIFICATE_OK_XPATH)
+    
     def get_total_issues_count(self):
         """Obtiene el número total de issues desde el encabezado"""
         try:
             # Estrategia 1: Buscar el texto "Issues (número)"
             try:
-                header_text = self.driver.find_element(
-                    By.XPATH, "//div[contains(text(), 'Issues') and contains(text(), '(')]"
-                ).text
+                header_text = self.driver.find_element(By.XPATH, ISSUES_TITLE_XPATH).text
                 logger.info(f"Texto del encabezado de issues: {header_text}")
                 
                 # Extraer el número entre paréntesis
@@ -707,10 +1471,11 @@ class SAPBrowser:
             # Estrategia 2: Buscar contador específico de SAP UI5
             try:
                 counter_element = self.driver.find_element(
-                    By.XPATH, "//div[contains(@class, 'sapMITBCount')]"
+                    By.CSS_SELECTOR, "div[class*='sapMITBCount']"
                 )
-                if counter_element.text.isdigit():
-                    return int(counter_element.text)
+                counter_text = counter_element.text
+                if counter_text.isdigit():
+                    return int(counter_text)
             except NoSuchElementException:
                 logger.warning("No se encontró contador de issues en formato SAP UI5")
             
@@ -731,37 +1496,19 @@ class SAPBrowser:
     def check_for_pagination(self):
         """Verifica si la tabla tiene paginación y devuelve los controles"""
         try:
-            # Selectores para controles de paginación
-            pagination_selectors = [
-                "//div[contains(@class, 'sapMPaginator')]",
-                "//div[contains(@class, 'sapUiTablePaginator')]",
-                "//div[contains(@class, 'pagination')]",
-                "//button[contains(@class, 'navButton') or contains(@aria-label, 'Next') or contains(@aria-label, 'Siguiente')]",
-                "//span[contains(@class, 'sapMPaginatorButton')]",
-                "//button[contains(text(), 'Next') or contains(text(), 'Siguiente')]",
-                "//a[contains(@class, 'sapMBtn') and contains(@aria-label, 'Next')]"
-            ]
+            # Paginación primero y luego "Show More" / "Load More", con el mismo orden de prioridad
+            # que antes, pero evaluados todos en una sola llamada
+            selectors = self.PAGINATION_SELECTORS + self.LOAD_MORE_SELECTORS
+            match = self.driver.execute_script(FIRST_SELECTOR_MATCH_SCRIPT, list(selectors))
             
-            for selector in pagination_selectors:
-                elements = self.driver.find_elements(By.XPATH, selector)
-                if elements:
+            if match:
+                index, elements = match
+                selector = selectors[index]
+                if index < len(self.PAGINATION_SELECTORS):
                     logger.info(f"Se encontraron controles de paginación: {len(elements)} elementos con selector {selector}")
-                    return elements
-            
-            # Buscar elementos "Show More" o "Load More"
-            load_more_selectors = [
-                "//button[contains(text(), 'More') or contains(text(), 'más') or contains(text(), 'Show')]",
-                "//a[contains(text(), 'More') or contains(text(), 'Load')]",
-                "//div[contains(@class, 'sapMListShowMoreButton')]",
-                "//span[contains(text(), 'Show') and contains(text(), 'More')]/..",
-                "//span[contains(@class, 'sapUiTableColShowMoreButton')]"
-            ]
-            
-            for selector in load_more_selectors:
-                elements = self.driver.find_elements(By.XPATH, selector)
-                if elements:
+                else:
                     logger.info(f"Se encontraron botones 'Show More': {len(elements)} elementos con selector {selector}")
-                    return elements
+                return elements
             
             logger.info("No se encontraron controles de paginación en la tabla")
             return None
@@ -785,24 +1532,38 @@ class SAPBrowser:
             return False
             
         try:
-            # Buscar el botón "Next" entre los elementos de paginación
             next_button = None
             
-            for element in pagination_elements:
-                try:
-                    aria_label = element.get_attribute("aria-label") or ""
-                    text = element.text.lower()
-                    classes = element.get_attribute("class") or ""
+            # Probar primero el botón que funcionó en la página anterior
+            if self._next_button_xpath:
+                cached_buttons = self.driver.find_elements(By.XPATH, self._next_button_xpath)
+                if cached_buttons:
+                    next_button = cached_buttons[0]
+                else:
+                    self._next_button_xpath = None
+            
+            # Buscar el botón "Next" entre los elementos de paginación, leyendo
+            # aria-label, texto y clase de todos los candidatos en una sola llamada
+            if next_button is None:
+                candidates = self.driver.execute_script("""
+                    return arguments[0].map(function(e) {
+                        return [e.getAttribute('aria-label') || '', e.innerText || '', e.className || ''];
+                    });
+                """, pagination_elements)
+                
+                for index, (aria_label, text, classes) in enumerate(candidates):
+                    aria_label = aria_label.lower()
+                    text = text.lower()
                     
                     # Comprobar si es un botón "Next" o "Siguiente"
-                    if ("next" in aria_label.lower() or 
-                        "siguiente" in aria_label.lower() or
+                    if ("next" in aria_label or 
+                        "siguiente" in aria_label or
                         "next" in text or 
                         "siguiente" in text or
-                        "show more" in text.lower() or
-                        "more" in text.lower()):
+                        "show more" in text or
+                        "more" in text):
                         
-                        next_button = element
+                        next_button = pagination_elements[index]
                         break
                         
                     # Comprobar por clase CSS
@@ -810,52 +1571,60 @@ class SAPBrowser:
                         "pagination-next" in classes.lower() or
                         "sapMBtn" in classes and "NavButton" in classes):
                         
-                        next_button = element
+                        next_button = pagination_elements[index]
                         break
-                except Exception:
-                    continue
             
             # Si se encontró un botón Next, intentar hacer clic
             if next_button:
-                # Verificar si el botón está habilitado
-                disabled = next_button.get_attribute("disabled") == "true" or next_button.get_attribute("aria-disabled") == "true"
+                if not self._next_button_xpath:
+                    self._next_button_xpath = self._xpath_for_element(next_button)
+                    
+                # Verificar si el botón está habilitado y llevarlo a la vista en la misma llamada
+                disabled = self.driver.execute_script("""
+                    var button = arguments[0];
+                    if (button.getAttribute('disabled') === 'true' || button.getAttribute('aria-disabled') === 'true') {
+                        return true;
+                    }
+                    button.scrollIntoView({block: 'center'});
+                    return false;
+                """, next_button)
                 
                 if disabled:
                     logger.info("Botón de siguiente página está deshabilitado")
                     return False
                     
-                # Scroll hacia el botón para asegurar que está visible
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                time.sleep(0.5)
+                previous_count = self._row_count_and_ui_state()["count"]
                 
                 # Intentar clic con distintos métodos, en orden de preferencia
                 try:
                     self.driver.execute_script("arguments[0].click();", next_button)
                     logger.info("Clic en botón 'Next' realizado con JavaScript")
-                    time.sleep(2)
+                    self.wait_for_row_count_change(previous_count)
                     return True
                 except JavascriptException:
                     try:
                         next_button.click()
                         logger.info("Clic en botón 'Next' realizado")
-                        time.sleep(2)
+                        self.wait_for_row_count_change(previous_count)
                         return True
                     except ElementClickInterceptedException:
                         from selenium.webdriver.common.action_chains import ActionChains
                         actions = ActionChains(self.driver)
                         actions.move_to_element(next_button).click().perform()
                         logger.info("Clic en botón 'Next' realizado con ActionChains")
-                        time.sleep(2)
+                        self.wait_for_row_count_change(previous_count)
                         return True
             
             # Si no se encontró botón específico, intentar con el último elemento
             if pagination_elements and len(pagination_elements) > 0:
                 last_element = pagination_elements[-1]
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", last_element)
-                time.sleep(0.5)
-                self.driver.execute_script("arguments[0].click();", last_element)
+                previous_count = self._row_count_and_ui_state()["count"]
+                self.driver.execute_script(
+                    "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();",
+                    last_element,
+                )
                 logger.info("Clic en último elemento de paginación realizado")
-                time.sleep(2)
+                self.wait_for_row_count_change(previous_count)
                 return True
             
             logger.warning("No se pudo identificar o hacer clic en el botón 'Next'")
@@ -865,6 +1634,30 @@ class SAPBrowser:
             logger.error(f"Error al hacer clic en paginación: {e}")
             return False
     
+    def _xpath_for_element(self, element):
+        """Calcula en el navegador una ruta XPath absoluta para un elemento"""
+        try:
+            return self.driver.execute_script("""
+                function getPathTo(node) {
+                    if (node.id) return "//*[@id='" + node.id + "']";
+                    if (node === document.body) return "/html/body";
+                    var index = 1;
+                    var siblings = node.parentNode.childNodes;
+                    for (var i = 0; i < siblings.length; i++) {
+                        var sibling = siblings[i];
+                        if (sibling === node) {
+                            return getPathTo(node.parentNode) + "/" + node.tagName.toLowerCase() + "[" + index + "]";
+                        }
+                        if (sibling.nodeType === 1 && sibling.tagName === node.tagName) index++;
+                    }
+                    return null;
+                }
+                return getPathTo(arguments[0]);
+            """, element)
+        except Exception as e:
+            logger.debug(f"No se pudo calcular el XPath del elemento: {e}")
+            return None
+    
     def scroll_to_load_all_items(self, total_expected=100, max_attempts=100):
         """Estrategia optimizada para cargar todos los elementos mediante scroll"""
         logger.info(f"Iniciando carga de {total_expected} elementos...")
@@ -879,59 +1672,45 @@ class SAPBrowser:
         
         logger.info(f"¿La tabla tiene paginación? {'Sí' if has_pagination else 'No'}")
         
+        html_element = None
+        
         for attempt in range(max_attempts):
             try:
-                # Estrategia 1: Scroll adaptativo con diferentes métodos
-                for scroll_method in range(3):
-                    if scroll_method == 0:
-                        # Scroll normal al final de la página
-                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    elif scroll_method == 1:
-                        # Scroll en contenedores específicos de SAP
-                        self.driver.execute_script("""
-                            var containers = document.querySelectorAll('.sapMListItems, .sapMTableTBody, .sapUiTableCtrlScr');
-                            if (containers.length > 0) {
-                                for(var i=0; i<containers.length; i++) {
-                                    containers[i].scrollTop = containers[i].scrollHeight;
-                                }
-                            }
-                        """)
-                    elif scroll_method == 2 and attempt % 3 == 0:
-                        # Scroll progresivo cada 3 intentos
-                        doc_height = self.driver.execute_script("return document.body.scrollHeight")
-                        for pos in range(0, doc_height, 300):
-                            self.driver.execute_script(f"window.scrollTo(0, {pos});")
-                            time.sleep(0.05)
+                # Estrategia 1: Tecla END sobre el documento, que activa la carga de las listas UI5
+                try:
+                    if html_element is None:
+                        html_element = self.driver.find_element(By.TAG_NAME, "html")
+                    html_element.send_keys(Keys.END)
+                except (StaleElementReferenceException, WebDriverException):
+                    html_element = None
+                
+                current_rows_count = self._row_count_and_ui_state()["count"]
+                
+                # Respaldo: scroll de página y contenedores SAP si la tecla no cargó filas nuevas
+                if current_rows_count < 0 or current_rows_count == previous_rows_count:
+                    current_rows_count = self._scroll_and_count_rows()
                 
                 # Estrategia 2: Hacer clic en botones "Show More" cada 2 intentos
                 if attempt % 2 == 0:
                     try:
-                        load_more_buttons = self.driver.find_elements(
-                            By.XPATH,
-                            "//button[contains(text(), 'More')] | " +
-                            "//button[contains(text(), 'más')] | " +
-                            "//a[contains(text(), 'More')] | " +
-                            "//div[contains(@class, 'sapMListShowMoreButton')]"
-                        )
+                        load_more_buttons = self.driver.find_elements(By.XPATH, self.SHOW_MORE_XPATH)
                         
                         if load_more_buttons:
                             for btn in load_more_buttons:
                                 try:
-                                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", btn)
-                                    time.sleep(0.3)
-                                    self.driver.execute_script("arguments[0].click();", btn)
+                                    # Desplazar y hacer clic en una sola llamada al navegador
+                                    self.driver.execute_script(
+                                        "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();",
+                                        btn,
+                                    )
                                     logger.info("Clic en botón 'Show More'")
-                                    time.sleep(1.5)
+                                    self.wait_for_row_count_change(current_rows_count, timeout=1.5)
                                     break  # Solo hacer clic en un botón por intento
                                 except:
                                     continue
                     except Exception as btn_e:
                         logger.debug(f"Error al buscar botón 'Show More': {btn_e}")
                 
-                # Contar filas visibles
-                rows = self.find_table_rows(highlight=False)
-                current_rows_count = len(rows)
-                
                 if attempt % 10 == 0:
                     logger.info(f"Intento {attempt+1}: {current_rows_count} filas cargadas")
                 
@@ -946,25 +1725,20 @@ class SAPBrowser:
                         if pagination_elements and self.click_pagination_next(pagination_elements):
                             logger.info("Se pasó a la siguiente página")
                             no_change_count = 0
-                            time.sleep(3)
                             continue
                     
                     # Si no hay cambios por muchos intentos, hacer scroll adicional
                     if no_change_count >= 5:
-                        # Scroll por posiciones incrementales
-                        for scroll_pos in range(1000, 10000, 1000):
-                            self.driver.execute_script(f"window.scrollTo(0, {scroll_pos});")
-                            time.sleep(0.3)
-                        
-                        # Intentar con teclas de dirección
+                        # Gesto de scroll nativo en una sola llamada CDP; si no está disponible,
+                        # el scroll de contenedores del siguiente intento actúa como respaldo
                         try:
-                            body = self.driver.find_element(By.TAG_NAME, "body")
-                            body.send_keys(Keys.PAGE_DOWN)
-                            time.sleep(0.3)
-                            body.send_keys(Keys.END)
-                            time.sleep(0.3)
-                        except:
-                            pass
+                            self.driver.execute_cdp_cmd("Input.synthesizeScrollGesture", {
+                                "x": 200, "y": 200,
+                                "xDistance": 0, "yDistance": -50000,
+                                "speed": 50000
+                            })
+                        except Exception as gesture_e:
+                            logger.debug(f"No se pudo sintetizar el gesto de scroll: {gesture_e}")
                     
                     # Criterios de finalización
                     if no_change_count >= no_change_threshold and current_rows_count >= total_expected * 0.9:
@@ -985,90 +1759,157 @@ class SAPBrowser:
                     logger.info(f"Se han cargado {current_rows_count} filas (>= {total_expected} esperadas)")
                     break
                 
-                # Tiempo adaptativo de espera
+                # Espera adaptativa: termina en cuanto cambian las filas o UI5 queda inactivo
                 wait_time = 0.2 + (no_change_count * 0.1)
-                time.sleep(min(wait_time, 1.0))
+                self.wait_for_row_count_change(current_rows_count, timeout=min(wait_time, 1.0))
                     
             except Exception as e:
                 logger.warning(f"Error durante el scroll en intento {attempt+1}: {e}")
+        
+        # El conteo del bucle es aproximado: contar las filas válidas una sola vez al final
+        loaded_rows = self.find_table_rows(highlight=False, target_count=total_expected)
+        previous_rows_count = len(loaded_rows)
             
         # Calcular cobertura
         coverage = (previous_rows_count / total_expected) * 100 if total_expected > 0 else 0
         logger.info(f"Scroll completado. Cobertura: {coverage:.2f}% ({previous_rows_count}/{total_expected})")
         
-        return previous_rows_count
+        # Devolver también las filas para que el llamador no tenga que buscarlas de nuevo
+        return previous_rows_count, loaded_rows
+    
+    def _row_count_and_ui_state(self):
+        """Devuelve el número de filas visibles y si la interfaz UI5 ha terminado de renderizar"""
+        return self.driver.execute_script("""
+            var rowXPath = arguments[0], count = -1;
+            if (rowXPath) {
+                count = document.evaluate(rowXPath, document, null,
+                    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+            }
+            var idle = false;
+            if (window.sap && sap.ui && sap.ui.getCore) {
+                idle = !sap.ui.getCore().getUIDirty() &&
+                    !document.querySelector('.sapUiLocalBusyIndicator');
+            }
+            return {count: count, idle: idle};
+        """, self._last_row_selector) or {"count": -1, "idle": False}
+    
+    def wait_until_ready(self, timeout=3):
+        """Espera a que la página y UI5 queden inactivos, como máximo timeout segundos"""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(self.UI_READY_SCRIPT)
+            )
+            return True
+        except TimeoutException:
+            logger.debug(f"La interfaz sigue ocupada tras {timeout}s de espera")
+            return False
+    
+    def wait_for_row_count_change(self, previous_count, timeout=3):
+        """Espera hasta que cambie el número de filas o UI5 termine de cargar, en lugar de una pausa fija"""
+        # Justo después del scroll o del clic UI5 aún aparece inactivo porque la petición de
+        # más filas no ha empezado: la inactividad solo cuenta tras verla ocupada o tras un mínimo
+        idle_after = time.monotonic() + min(timeout, self.ROW_WAIT_MIN_IDLE)
+        saw_busy = False
+        
+        def settled(driver):
+            nonlocal saw_busy
+            state = self._row_count_and_ui_state()
+            if state["count"] != previous_count:
+                return True
+            if not state["idle"]:
+                saw_busy = True
+                return False
+            return saw_busy or time.monotonic() >= idle_after
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(settled)
+            return True
+        except TimeoutException:
+            logger.debug(f"Sin cambios en las filas tras {timeout}s de espera")
+            return False
     
-    def find_table_rows(self, highlight=False):
+    def _scroll_and_count_rows(self):
+        """Hace scroll en la página y contenedores SAP y cuenta las filas en una sola evaluación CDP"""
+        expression = """
+        (function(rowXPath) {
+            window.scrollTo(0, document.body.scrollHeight);
+            var containers = document.querySelectorAll('.sapMListItems, .sapMTableTBody, .sapUiTableCtrlScr');
+            for (var i = 0; i < containers.length; i++) {
+                containers[i].scrollTop = containers[i].scrollHeight;
+            }
+            var count = -1;
+            if (rowXPath) {
+                count = document.evaluate(rowXPath, document, null,
+                    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+            }
+            return {count: count};
+        })(%s)
+        """ % json.dumps(self._last_row_selector)
+        
+        try:
+            response = self.driver.execute_cdp_cmd(
+                "Runtime.evaluate", {"expression": expression, "returnByValue": True}
+            )
+            result = response.get("result", {}).get("value") or {}
+        except Exception as e:
+            # Navegadores sin CDP: misma evaluación mediante execute_script
+            logger.debug(f"Runtime.evaluate no disponible, usando execute_script: {e}")
+            result = self.driver.execute_script("return " + expression) or {}
+            
+        count = result.get("count", -1)
+        if count is None or count < 0:
+            # Aún no se conoce el selector de filas: recurrir a la búsqueda completa
+            count = len(self.find_table_rows(highlight=False))
+            
+        return count
+    
+    def find_table_rows(self, highlight=False, target_count=None):
         """Encuentra todas las filas de la tabla con múltiples estrategias"""
         all_rows = []
+        row_keys = []  # Identificadores estables calculados en el navegador
+        chosen_selector = None
         
         # Usar caché si está disponible
         cache_key = "table_rows"
         if cache_key in self.element_cache:
             cache_time, cached_rows = self.element_cache[cache_key]
-            if (datetime.now() - cache_time).total_seconds() < 5:  # Caché válida por 5 segundos
+            if time.monotonic() - cache_time < self.ELEMENT_CACHE_TTL:
                 logger.debug("Usando filas en caché")
                 return cached_rows
 
-        # Selectores mejorados para SAP UI5
-        selectors = [
-            # Selectores de SAP estándar
-            "//table[contains(@class, 'sapMListTbl')]/tbody/tr[not(contains(@class, 'sapMListTblHeader'))]",
-            "//div[contains(@class, 'sapMList')]//li[contains(@class, 'sapMLIB')]",
-            "//table[contains(@class, 'sapMList')]/tbody/tr",
-            "//div[@role='row'][not(contains(@class, 'sapMListHeaderSubTitleItems')) and not(contains(@class, 'sapMListTblHeader'))]",
-            "//div[contains(@class, 'sapMListItems')]/div[contains(@class, 'sapMListItem')]",
-            "//div[contains(@class, 'sapMListItems')]//div[contains(@class, 'sapMObjectIdentifier')]/..",
-            "//div[contains(@class, 'sapMListItem')]",
-            
-            # Selectores de Fiori
-            "//div[contains(@class, 'sapMList')]//li[@tabindex]",
-            "//div[contains(@class, 'sapUiTable')]//tr[contains(@class, 'sapUiTableRow')]",
-            "//div[contains(@class, 'sapUiTableRowHdr')]/..",
-            "//table[contains(@class, 'sapMTable')]//tr[not(contains(@class, 'sapMListTblHeaderRow'))]",
-            
-            # Selectores específicos de SDWork Center
-            "//div[contains(@class, 'sdworkItems')]//div[contains(@class, 'sapMLIB')]",
-            "//div[contains(@class, 'issueList')]//div[contains(@class, 'sapMLIB')]",
-            "//div[contains(@id, 'issue')]//div[contains(@class, 'sapMLIB')]",
-            
-            # Selectores genéricos más específicos
-            "//div[contains(@class, 'sapMLIB-CTX')]",
-            "//div[contains(@class, 'sapMObjectListItem')]",
-            "//div[contains(@class, 'sapMListModeMultiSelect')]//div[contains(@class, 'sapMLIB')]"
-        ]
+        
+        # Probar primero los selectores que ya funcionaron en esta página (orden estable)
+        selector_hits = self._selector_stats.setdefault(self._page_key(), {})
+        selectors = sorted(self.ROW_SELECTORS, key=lambda selector: -selector_hits.get(selector, 0))
+
+        # Contar todos los selectores en el navegador con una sola llamada (sobre el mismo DOM
+        # que usa find_elements) y pedir los elementos solo de los que tienen coincidencias
+        match_counts = self._count_xpath_matches(selectors)
 
         for selector in selectors:
+            if match_counts is not None and match_counts.get(selector) == 0:
+                continue
+                
             try:
                 rows = self.driver.find_elements(By.XPATH, selector)
                 if len(rows) > 0:
                     logger.info(f"Se encontraron {len(rows)} filas con selector: {selector}")
                     
                     # Filtrar filas válidas
-                    valid_rows = []
-                    for row in rows:
-                        try:
-                            has_content = False
-                            text_elements = row.find_elements(By.XPATH, ".//span | .//div | .//a")
-                            for element in text_elements:
-                                if element.text and element.text.strip():
-                                    has_content = True
-                                    break
-                                    
-                            if has_content:
-                                # Verificar que no sea un encabezado
-                                class_attr = row.get_attribute("class") or ""
-                                is_header = "header" in class_attr.lower()
-                                if not is_header:
-                                    valid_rows.append(row)
-                        except:
-                            valid_rows.append(row)  # Si hay error, incluir por si acaso
+                    valid_rows, valid_keys = self._filter_valid_rows(rows)
                     
                     if len(valid_rows) > 0:
                         all_rows = valid_rows
+                        row_keys = valid_keys
+                        chosen_selector = selector
+                        self._last_row_selector = selector
                         
                         if len(valid_rows) >= 75:  # Si encontramos muchas filas, probablemente es el selector correcto
                             break
+                        if target_count and len(valid_rows) >= target_count:
+                            break
+                        if selector_hits.get(selector):  # Ya fue el selector elegido antes
+                            break
             except Exception as e:
                 logger.debug(f"Error con selector {selector}: {e}")
         
@@ -1076,25 +1917,22 @@ class SAPBrowser:
         if len(all_rows) == 0:
             logger.warning("Usando enfoque alternativo para encontrar filas")
             try:
-                any_rows = self.driver.find_elements(
-                    By.XPATH,
-                    "//div[contains(@class, 'sapM')] | //tr | //li[contains(@class, 'sapM')]"
-                )
-                
-                for element in any_rows:
-                    try:
-                        # Verificar si parece una fila de datos
-                        if element.text and len(element.text.strip()) > 10:
-                            children = element.find_elements(By.XPATH, ".//*")
-                            if len(children) >= 3:
-                                parent_elements = element.find_elements(
-                                    By.XPATH, 
-                                    "./ancestor::div[contains(@class, 'sapMList') or contains(@class, 'sapMTable')]"
-                                )
-                                if len(parent_elements) > 0:
-                                    all_rows.append(element)
-                    except:
-                        continue
+                # Selectores CSS (motor nativo del navegador) y filtrado en la misma llamada:
+                # texto de más de 10 caracteres, al menos 3 descendientes y dentro de una lista/tabla SAP
+                all_rows = self.driver.execute_script("""
+                    var candidates = document.querySelectorAll("div[class*='sapM'], tr, li[class*='sapM']");
+                    var rows = [];
+                    for (var i = 0; i < candidates.length; i++) {
+                        var element = candidates[i];
+                        if ((element.innerText || "").trim().length <= 10) continue;
+                        if (element.querySelectorAll("*").length < 3) continue;
+                        var parent = element.parentElement;
+                        if (parent && parent.closest("div[class*='sapMList'], div[class*='sapMTable']")) {
+                            rows.push(element);
+                        }
+                    }
+                    return rows;
+                """) or []
                         
                 logger.info(f"Enfoque alternativo encontró {len(all_rows)} posibles filas")
             except Exception as e:
@@ -1110,33 +1948,28 @@ class SAPBrowser:
             except:
                 pass
         
-        # Eliminar duplicados manteniendo el orden
+        # Eliminar duplicados manteniendo el orden. Los identificadores ya vienen del
+        # navegador; en el enfoque alternativo se usa la referencia local del WebElement
+        if len(row_keys) != len(all_rows):
+            row_keys = [row.id for row in all_rows]
+            
         unique_rows = []
-        seen_ids = set()
+        unique_keys = {}
         
-        for row in all_rows:
-            try:
-                row_id = row.id
-                if row_id not in seen_ids:
-                    seen_ids.add(row_id)
-                    unique_rows.append(row)
-            except:
-                # Si no podemos obtener un ID, usar aproximación con texto y clase
-                try:
-                    row_text = row.text[:50] if row.text else ""
-                    row_class = row.get_attribute("class") or ""
-                    row_signature = f"{row_text}|{row_class}"
-                    
-                    if row_signature not in seen_ids:
-                        seen_ids.add(row_signature)
-                        unique_rows.append(row)
-                except:
-                    unique_rows.append(row)
+        for row, row_key in zip(all_rows, row_keys):
+            if row_key not in unique_keys:
+                unique_keys[row_key] = len(unique_rows)
+                unique_rows.append(row)
         
         logger.info(f"Total de filas únicas encontradas: {len(unique_rows)}")
         
+        if chosen_selector:
+            selector_hits[chosen_selector] = selector_hits.get(chosen_selector, 0) + 1
+            self._selector_stats_changed = True
+        
         # Actualizar caché
-        self.element_cache[cache_key] = (datetime.now(), unique_rows)
+        self._cache_element(cache_key, unique_rows)
+        self._cache_element("table_row_keys", unique_keys)
         
         return unique_rows
     
@@ -1147,20 +1980,137 @@ class SAPBrowser:
     
     
     
+    def _page_key(self):
+        """Identifica la página actual (host y ruta, sin parámetros) para las estadísticas de selectores"""
+        try:
+            parts = urlsplit(self.driver.current_url)
+            return f"{parts.netloc}{parts.path}"
+        except Exception:
+            return ""
+    
+    def _load_selector_stats(self):
+        """Carga las estadísticas de selectores guardadas en ejecuciones anteriores"""
+        try:
+            if os.path.exists(self.SELECTOR_STATS_PATH):
+                with open(self.SELECTOR_STATS_PATH, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.debug(f"No se pudieron cargar las estadísticas de selectores: {e}")
+        return {}
+    
+    def _save_selector_stats(self):
+        """Guarda las estadísticas de selectores al terminar el proceso"""
+        if not self._selector_stats_changed:
+            return
+        try:
+            stats_dir = os.path.dirname(self.SELECTOR_STATS_PATH)
+            if not os.path.exists(stats_dir):
+                os.makedirs(stats_dir)
+            with open(self.SELECTOR_STATS_PATH, 'w') as f:
+                json.dump(self._selector_stats, f)
+        except Exception as e:
+            logger.debug(f"No se pudieron guardar las estadísticas de selectores: {e}")
+    
+    def _invalidate_caches(self):
+        """Descarta los elementos y XPath en caché, que dejan de ser válidos al cambiar de página"""
+        self.element_cache.clear()
+        self._next_button_xpath = None
+        self._last_row_selector = None
+        with self._row_cache_lock:
+            self._row_texts_cache.clear()
+            self._row_cell_cache.clear()
+    
+    def _cache_element(self, key, value):
+        """Guarda un valor en la caché de elementos, descartando la entrada menos reciente si está llena"""
+        self.element_cache[key] = (time.monotonic(), value)
+        self.element_cache.move_to_end(key)
+        while len(self.element_cache) > self.ELEMENT_CACHE_MAX_SIZE:
+            self.element_cache.popitem(last=False)
+    
+    def _filter_valid_rows(self, rows):
+        """Descarta encabezados y filas sin texto y devuelve las filas válidas con un identificador estable"""
+        script = """
+        var rows = arguments[0];
+        var valid = [];
+        for (var i = 0; i < rows.length; i++) {
+            var row = rows[i];
+            // Verificar que no sea un encabezado
+            if (/header/i.test(row.getAttribute("class") || "")) continue;
+            var elements = row.querySelectorAll("span, div, a");
+            for (var j = 0; j < elements.length; j++) {
+                if ((elements[j].innerText || "").trim()) {
+                    valid.push([i, row.id || row.getAttribute("data-sap-ui") || null]);
+                    break;
+                }
+            }
+        }
+        return valid;
+        """
+        
+        try:
+            valid_entries = self.driver.execute_script(script, rows)
+            # Sin id en el DOM se usa la referencia del WebElement, que nunca une nodos distintos
+            return (
+                [rows[i] for i, _ in valid_entries],
+                [key or rows[i].id for i, key in valid_entries],
+            )
+        except Exception as e:
+            logger.debug(f"Error al filtrar filas con JavaScript: {e}")
+            return list(rows), []  # Si hay error, incluir por si acaso
+    
+    def _count_xpath_matches(self, selectors):
+        """Cuenta las coincidencias de cada selector XPath en el DOM vivo con una sola llamada"""
+        try:
+            counts = self.driver.execute_script(XPATH_COUNTS_SCRIPT, list(selectors))
+        except Exception as e:
+            logger.debug(f"No se pudieron contar los selectores en el navegador: {e}")
+            return None
+            
+        # null si el navegador no pudo evaluar el selector: se deja que find_elements lo resuelva
+        return dict(zip(selectors, counts or []))
+    
     def extract_issues_data(self):
         """Extrae datos de issues desde la tabla con procesamiento mejorado"""
         try:
             logger.info("Iniciando extracción de issues...")
             
-            # Esperar a que cargue la página inicial
-            time.sleep(3)
+            # Los IDs del DOM cambian entre sesiones: filas y botón "Next" se vuelven a detectar
+            self._invalidate_caches()
+            
+            # Intentar primero leer los issues desde las respuestas OData de la página
+            odata_issues = self.extract_issues_data_fast()
+            if odata_issues:
+                total_issues = self.get_total_issues_count()
+                
+                # La respuesta capturada puede ser solo la primera página de la lista
+                if len(odata_issues) < total_issues and self.PARALLEL_PAGINATION:
+                    try:
+                        parallel_issues = self.extract_issues_parallel(total_issues)
+                    except RuntimeError as e:
+                        # Descarga incompleta: la extracción desde la tabla cubre la lista entera
+                        logger.warning(f"Descarga paralela incompleta: {e}")
+                        parallel_issues = []
+                    if len(parallel_issues) > len(odata_issues):
+                        odata_issues = parallel_issues
+                        
+                if len(odata_issues) >= total_issues:
+                    return [self._validate_and_correct_issue_data(issue) for issue in odata_issues]
+                    
+                # Lista incompleta: se extrae desde la tabla para no truncar el resultado
+                logger.info(
+                    f"Las respuestas OData solo cubren {len(odata_issues)} de {total_issues} issues, "
+                    "se extraerán desde la tabla"
+                )
+            
+            # Esperar a que cargue la página inicial (como máximo los 3 segundos de antes)
+            self.wait_until_ready(timeout=3)
             
             # Obtener el número total de issues
             total_issues = self.get_total_issues_count()
             logger.info(f"Total de issues a procesar: {total_issues}")
             
             # Hacer scroll para cargar todos los elementos
-            loaded_rows_count = self.scroll_to_load_all_items(total_issues)
+            loaded_rows_count, loaded_rows = self.scroll_to_load_all_items(total_issues)
             
             # Verificar si hay paginación
             pagination_elements = self.check_for_pagination()
@@ -1176,8 +2126,11 @@ class SAPBrowser:
             while page_num <= max_pages:
                 logger.info(f"Procesando página {page_num}...")
                 
-                # Obtener filas de la página actual
-                rows = self.find_table_rows(highlight=False)
+                # Obtener filas de la página actual (la primera ya se obtuvo al hacer scroll)
+                if page_num == 1 and loaded_rows:
+                    rows = loaded_rows
+                else:
+                    rows = self.find_table_rows(highlight=False, target_count=total_issues)
                 
                 if not rows:
                     logger.warning(f"No se encontraron filas en la página {page_num}")
@@ -1186,7 +2139,14 @@ class SAPBrowser:
                 logger.info(f"Encontradas {len(rows)} filas en la página {page_num}")
                 
                 # Procesar filas en esta página
-                page_issues_data = self._process_table_rows(rows, seen_titles)
+                page_issues_data = None
+                if self.USE_PLAYWRIGHT:
+                    page_issues_data = self._extract_page_with_playwright()
+                if not page_issues_data:
+                    # Toda la página en una sola llamada; fila a fila solo si faltan campos
+                    page_issues_data = self._extract_page_js()
+                if not page_issues_data:
+                    page_issues_data = self._process_table_rows(rows, seen_titles)
                 
                 # Validar y corregir los datos extraídos
                 corrected_data = []
@@ -1211,7 +2171,7 @@ class SAPBrowser:
                         break
                         
                     # Esperar a que cargue la nueva página
-                    time.sleep(3)
+                    self.wait_until_ready(timeout=3)
                     
                     # Actualizar elementos de paginación (pueden cambiar entre páginas)
                     pagination_elements = self.check_for_pagination()
@@ -1237,105 +2197,539 @@ class SAPBrowser:
 
 
 
-    def _process_table_rows(self, rows, seen_titles):
-        """Procesa las filas de la tabla y extrae los datos de cada issue"""
-        issues_data = []
-        processed_count = 0
-        batch_size = 10  # Procesar en lotes para actualizar progreso
+    def extract_issues_data_fast(self, timeout=5):
+        """Obtiene los issues directamente de las respuestas OData/JSON capturadas por CDP"""
+        end_time = time.time() + timeout
         
-        for index, row in enumerate(rows):
+        while True:
+            issues = self._read_odata_issues()
+            if issues:
+                logger.info(f"Se obtuvieron {len(issues)} issues desde respuestas OData")
+                return issues
+                
+            if time.time() >= end_time:
+                break
+            time.sleep(0.5)
+            
+        logger.info("No se detectaron respuestas OData de issues, se extraerán desde la tabla")
+        return []
+    
+    def _read_odata_issues(self):
+        """Lee el registro de rendimiento y extrae los issues de las respuestas OData"""
+        try:
+            log_entries = self.driver.get_log("performance")
+        except Exception as e:
+            logger.debug(f"No se pudo leer el registro de rendimiento: {e}")
+            return []
+            
+        # Issues por entity set (último segmento de la ruta); solo se usa el que respalda la lista
+        entity_sets = {}
+        for entry in log_entries:
             try:
-                # Extraer título
-                title = self._extract_title(row)
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError, TypeError):
+                continue
                 
-                if not title:
-                    title = f"Issue sin título #{index+1}"
+            if message.get("method") != "Network.responseReceived":
+                continue
                 
-                # Permitir duplicados - Eliminar verificación de duplicados
-                # Comentando esta parte para permitir la descarga de duplicados
-                """
-                # Verificar duplicados
-                title_lower = title.lower()
-                if title_lower in seen_titles:
-                    continue
+            params = message.get("params", {})
+            response_url = params.get("response", {}).get("url", "")
+            url = response_url.lower()
+            entity_set = self._odata_entity_set(url)
+            is_odata = "/odata/" in url or url.split("?")[0].endswith(".json")
+            if not is_odata or "issue" not in entity_set:
+                continue
                 
-                seen_titles.add(title_lower)
-                """
+            try:
+                response = self.driver.execute_cdp_cmd(
+                    "Network.getResponseBody", {"requestId": params["requestId"]}
+                )
+                payload = json.loads(response.get("body", ""))
+            except Exception as e:
+                logger.debug(f"No se pudo leer la respuesta OData {url}: {e}")
+                continue
                 
-                # Extraer resto de datos
-                type_text = self._extract_type(row, title)
-                priority = self._extract_priority(row)
-                status = self._extract_status(row)
-                deadline = self._extract_deadline(row)
-                due_date = self._extract_due_date(row)
-                created_by = self._extract_created_by(row)
-                created_on = self._extract_created_on(row)
-                
-                # Datos del issue completos
-                issue_data = {
-                    'Title': title,
-                    'Type': type_text,
-                    'Priority': priority,
-                    'Status': status,
-                    'Deadline': deadline,
-                    'Due Date': due_date,
-                    'Created By': created_by,
-                    'Created On': created_on
-                }
+            records = self._odata_payload_to_keyed_issues(payload, response_url)
+            if records:
+                records.extend(self._fetch_odata_next_pages(response_url, payload))
+                entity_sets.setdefault(entity_set, (response_url, []))[1].extend(records)
                 
-                issues_data.append(issue_data)
-                processed_count += 1
+        if not entity_sets:
+            return []
+            
+        # Quedarse con el entity set ya detectado o, la primera vez, con el de más issues
+        locked_set = self._odata_entity_set(self._odata_issues_url or "")
+        if locked_set not in entity_sets:
+            locked_set = max(entity_sets, key=lambda name: len(entity_sets[name][1]))
+        self._odata_issues_url, records = entity_sets[locked_set]
+            
+        # La misma lista puede haberse pedido varias veces (refrescos, growing)
+        return self._unique_by_key(records)
+    
+    @staticmethod
+    def _odata_entity_set(url):
+        """Nombre del entity set de una URL OData (último segmento de la ruta, sin clave)"""
+        return urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1].split("(")[0].lower()
+    
+    @staticmethod
+    def _unique_by_key(keyed_issues):
+        """Elimina registros OData repetidos por su clave; títulos repetidos son issues distintos"""
+        unique_issues = []
+        seen_keys = set()
+        for key, issue in keyed_issues:
+            if key not in seen_keys:
+                seen_keys.add(key)
+                unique_issues.append(issue)
+        return unique_issues
+    
+    @staticmethod
+    def _odata_next_link(payload):
+        """Enlace a la página siguiente de una respuesta OData (v2 __next, v4 @odata.nextLink)"""
+        if not isinstance(payload, dict):
+            return None
+        data = payload.get("d")
+        if isinstance(data, dict) and data.get("__next"):
+            return data["__next"]
+        return payload.get("@odata.nextLink") or payload.get("odata.nextLink")
+    
+    def _fetch_odata_next_pages(self, url, payload, max_pages=100):
+        """Sigue los enlaces de página siguiente desde el navegador, con la sesión del usuario"""
+        issues = []
+        next_link = self._odata_next_link(payload)
+        
+        for _ in range(max_pages):
+            if not next_link:
+                break
+            url = urljoin(url, next_link)
+            try:
+                body = self.driver.execute_script(ODATA_FETCH_SCRIPT, url)
+                payload = json.loads(body or "")
+            except Exception as e:
+                logger.debug(f"No se pudo leer la página OData siguiente {url}: {e}")
+                break
                 
-                if processed_count % batch_size == 0:
-                    logger.info(f"Procesados {processed_count} issues hasta ahora")
+            issues.extend(self._odata_payload_to_keyed_issues(payload, url))
+            next_link = self._odata_next_link(payload)
+            
+        return issues
+    
+    @classmethod
+    def _odata_payload_to_keyed_issues(cls, payload, page_url):
+        """Convierte una respuesta OData v2/v4 en pares (clave del registro, issue)"""
+        records = payload
+        if isinstance(records, dict):
+            # OData v2 usa {"d": {"results": [...]}} y OData v4 {"value": [...]}
+            records = records.get("d", records)
+            if isinstance(records, dict):
+                records = records.get("results", records.get("value", []))
                 
-            except Exception as e:
-                logger.error(f"Error al procesar la fila {index}: {e}")
+        if not isinstance(records, list):
+            return []
+            
+        issues = []
+        for index, record in enumerate(records):
+            if not isinstance(record, dict):
+                continue
+                
+            fields = {re.sub(r'[^a-z]', '', str(key).lower()): value for key, value in record.items()}
+            
+            issue_data = {}
+            for column, aliases in ODATA_FIELD_ALIASES.items():
+                value = next((fields[alias] for alias in aliases if fields.get(alias) is not None), "")
+                issue_data[column] = cls._format_odata_value(value)
+                
+            # Sin título, o sin suficientes campos propios de un issue, no es un issue de la lista
+            if not issue_data["Title"]:
+                continue
+            evidence = sum(1 for column in ODATA_ISSUE_EVIDENCE_COLUMNS if issue_data[column])
+            if evidence < ODATA_MIN_ISSUE_EVIDENCE:
+                continue
+                
+            # Clave de la entidad; sin ella, la posición dentro de la página ($skip incluido en la URL)
+            metadata = record.get("__metadata")
+            key = (metadata.get("uri") if isinstance(metadata, dict) else None) or record.get("@odata.id")
+            if not key:
+                key = next((fields[name] for name in ODATA_KEY_FIELDS if fields.get(name)), None)
+            if not key:
+                key = (page_url, index)
+                
+            issue_data["Priority"] = cls._normalize_priority(issue_data["Priority"])
+            issue_data["Status"] = cls._normalize_status(issue_data["Status"])
+            issues.append((key, issue_data))
+            
+        return issues
+    
+    @staticmethod
+    def _format_odata_value(value):
+        """Convierte valores OData (incluidas fechas /Date(ms)/) a texto"""
+        if isinstance(value, (dict, list)):
+            return ""
+            
+        text = str(value).strip()
+        match = re.match(r'^/Date\((-?\d+)', text)
+        if match:
+            return datetime.fromtimestamp(int(match.group(1)) / 1000).strftime("%Y-%m-%d")
+        return text
+    
+    def extract_issues_parallel(self, total_issues, page_size=100, workers=None):
+        """Descarga las páginas OData de issues en paralelo con varios navegadores headless"""
+        if not self._odata_issues_url:
+            logger.info("No se conoce la URL OData de issues, se omite la descarga paralela")
+            return []
+            
+        skips = list(range(0, max(total_issues, 1), page_size))
+        workers = min(workers or os.cpu_count() or 1, len(skips))
+        
+        # Repartir las páginas en rangos contiguos, uno por proceso
+        chunk_size = -(-len(skips) // workers)
+        cookies = self.driver.get_cookies()
+        jobs = [
+            (self._odata_issues_url, cookies, skips[i:i + chunk_size], page_size)
+            for i in range(0, len(skips), chunk_size)
+        ]
+        
+        logger.info(f"Descargando {len(skips)} páginas OData con {len(jobs)} procesos")
+        try:
+            with multiprocessing.Pool(processes=len(jobs)) as pool:
+                results = pool.map(_scrape_odata_page_range, jobs)
+        except Exception as e:
+            logger.error(f"Error en la descarga paralela de páginas: {e}")
+            return []
+            
+        # Cada proceso informa de su propio fallo: se indica qué rango de páginas falló
+        failures = []
+        for (_, _, job_skips, _), (_, error) in zip(jobs, results):
+            if error:
+                page_range = f"$skip {job_skips[0]}-{job_skips[-1] + page_size - 1}"
+                logger.error(f"Falló la descarga OData de {page_range}: {error}")
+                failures.append(f"{page_range}: {error}")
+        if failures:
+            raise RuntimeError(f"{len(failures)} de {len(jobs)} rangos de páginas fallaron ({'; '.join(failures)})")
+            
+        # Unir resultados y eliminar registros repetidos por su clave OData
+        issues = self._unique_by_key(
+            keyed_issue for page_issues, _ in results for keyed_issue in page_issues
+        )
+                    
+        logger.info(f"Descarga paralela completada: {len(issues)} issues")
+        return issues
+    
+    def _process_table_rows(self, rows, seen_titles):
+        """Procesa las filas de la tabla y extrae los datos de cada issue"""
+        issues_data = []
+        processed_count = 0
+        batch_size = 10  # Procesar en lotes para actualizar progreso
+        
+        # Extraer todas las filas de una vez en el navegador; los métodos _extract_*
+        # quedan como respaldo para los campos que el script no pudo resolver
+        bulk_data = self._bulk_extract_rows_js(rows) or [None] * len(rows)
+        
+        if self.THREADED_ROW_EXTRACTION and len(rows) > 1:
+            # Solapar la latencia de las llamadas de respaldo al WebDriver (útil con Grid remoto)
+            with ThreadPoolExecutor(max_workers=self.ROW_EXTRACTION_WORKERS) as executor:
+                results = list(executor.map(self._extract_one_row, range(len(rows)), rows, bulk_data))
+        else:
+            results = map(self._extract_one_row, range(len(rows)), rows, bulk_data)
+        
+        for issue_data in results:
+            if issue_data is None:
+                continue
+                
+            issues_data.append(issue_data)
+            processed_count += 1
+            
+            if processed_count % batch_size == 0:
+                logger.info(f"Procesados {processed_count} issues hasta ahora")
         
         logger.info(f"Procesamiento de filas completado. Total procesado: {processed_count} issues")
         return issues_data
+    
+    def _extract_one_row(self, index, row, row_data):
+        """Extrae los datos de un issue a partir de una fila y sus valores precalculados"""
+        try:
+            # Sin extracción masiva: leer el HTML de la fila una vez y analizarlo localmente
+            if row_data is None:
+                row_data = self._parse_row_html(row.get_attribute("outerHTML") or "")
+                
+            # Extraer título
+            title = self._bulk_value(row_data, "Title", self._extract_title, row)
+            
+            if not title:
+                title = f"Issue sin título #{index+1}"
+            
+            # Permitir duplicados - Eliminar verificación de duplicados
+            # Comentando esta parte para permitir la descarga de duplicados
+            """
+            # Verificar duplicados
+            title_lower = title.lower()
+            if title_lower in seen_titles:
+                continue
+            
+            seen_titles.add(title_lower)
+            """
+            
+            # Extraer resto de datos
+            type_text = self._bulk_value(row_data, "Type", self._extract_type, row, title)
+            priority = self._bulk_value(row_data, "Priority", self._extract_priority, row)
+            status = self._bulk_value(row_data, "Status", self._extract_status, row)
+            deadline = self._bulk_value(row_data, "Deadline", self._extract_deadline, row)
+            due_date = self._bulk_value(row_data, "Due Date", self._extract_due_date, row)
+            created_by = self._bulk_value(row_data, "Created By", self._extract_created_by, row)
+            created_on = self._bulk_value(row_data, "Created On", self._extract_created_on, row)
+            
+            # Datos del issue completos
+            return {
+                'Title': title,
+                'Type': type_text,
+                'Priority': priority,
+                'Status': status,
+                'Deadline': deadline,
+                'Due Date': due_date,
+                'Created By': created_by,
+                'Created On': created_on
+            }
+            
+        except Exception as e:
+            logger.error("Error al procesar la fila %s: %s", index, e)
+            return None
 
 
 
+    def _bulk_extract_rows_js(self, rows):
+        """Extrae los campos de todas las filas con una única llamada JavaScript"""
+        
+        try:
+            bulk_data = self.driver.execute_script(BULK_ROWS_SCRIPT, rows, PRIORITY_COLOR_LABELS)
+        except Exception as e:
+            logger.debug(f"Error en extracción masiva con JavaScript: {e}")
+            return None
+            
+        if not bulk_data or len(bulk_data) != len(rows):
+            return None
+            
+        self._normalize_bulk_rows(bulk_data)
+                
+        logger.info(f"Extracción masiva con JavaScript completada para {len(bulk_data)} filas")
+        return bulk_data
+    
+    def _normalize_bulk_rows(self, bulk_data):
+        """Normaliza en Python los campos extraídos en bloque, igual que los extractores individuales"""
+        for row_data in bulk_data:
+            if row_data.get("Priority"):
+                row_data["Priority"] = self._normalize_priority(row_data["Priority"])
+            if row_data.get("Status"):
+                row_data["Status"] = self._normalize_status(row_data["Status"])
+    
+    def _get_playwright_page(self):
+        """Conecta Playwright por CDP al Chrome abierto por Selenium y devuelve la página actual"""
+        if self._playwright_page is not None:
+            return self._playwright_page
+            
+        try:
+            from playwright.sync_api import sync_playwright
+        except ImportError:
+            logger.debug("Playwright no está instalado, se usa Selenium")
+            return None
+            
+        try:
+            debugger_address = self.driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+            if not debugger_address:
+                return None
+                
+            if self._playwright is None:
+                self._playwright = sync_playwright().start()
+            browser = self._playwright.chromium.connect_over_cdp(f"http://{debugger_address}")
+            
+            current_url = self.driver.current_url
+            for context in browser.contexts:
+                for page in context.pages:
+                    if page.url == current_url:
+                        self._playwright_page = page
+                        logger.info("Playwright conectado al navegador de Selenium")
+                        return page
+        except Exception as e:
+            logger.debug(f"No se pudo conectar Playwright al navegador: {e}")
+            
+        return None
+    
+    def _extract_page_with_playwright(self):
+        """Extrae los issues de la página actual en una sola evaluación de Playwright"""
+        if not self._last_row_selector:
+            return None
+            
+        page = self._get_playwright_page()
+        if page is None:
+            return None
+            
+        try:
+            bulk_data = page.evaluate(
+                "(args) => (" + PAGE_ROWS_FUNCTION + ").apply(null, args)",
+                [self._last_row_selector, PRIORITY_COLOR_LABELS]
+            )
+        except Exception as e:
+            logger.debug(f"Error en extracción con Playwright: {e}")
+            return None
+            
+        issues_data = self._page_rows_to_issues(bulk_data, allow_missing=True)
+        if issues_data:
+            logger.info(f"Extracción con Playwright completada para {len(issues_data)} filas")
+        return issues_data
+    
+    def _extract_page_js(self):
+        """Extrae los issues de la página actual con un único execute_script, sin recorrer filas en Python"""
+        if not self._last_row_selector:
+            return None
+            
+        try:
+            bulk_data = self.driver.execute_script(
+                "return (" + PAGE_ROWS_FUNCTION + ").apply(null, arguments);",
+                self._last_row_selector, PRIORITY_COLOR_LABELS
+            )
+        except Exception as e:
+            logger.debug(f"Error en extracción de página con JavaScript: {e}")
+            return None
+            
+        # Con Selenium sí hay extractores de respaldo: si algún campo quedó sin resolver
+        # se devuelve None para que la página se procese fila a fila
+        issues_data = self._page_rows_to_issues(bulk_data, allow_missing=False)
+        if issues_data:
+            logger.info(f"Extracción de página con JavaScript completada para {len(issues_data)} filas")
+        return issues_data
+    
+    def _page_rows_to_issues(self, bulk_data, allow_missing):
+        """Convierte los campos extraídos de una página completa en la lista de issues"""
+        if not bulk_data:
+            return None
+            
+        if not allow_missing and any(value is None for row_data in bulk_data for value in row_data.values()):
+            return None
+            
+        self._normalize_bulk_rows(bulk_data)
+        
+        # Los campos no resueltos quedan vacíos
+        issues_data = []
+        for index, row_data in enumerate(bulk_data):
+            issue_data = {field: value or "" for field, value in row_data.items()}
+            if not issue_data["Title"]:
+                issue_data["Title"] = f"Issue sin título #{index+1}"
+            issues_data.append(issue_data)
+            
+        return issues_data
+    
+    def _parse_row_html(self, row_html):
+        """Extrae los campos de una fila a partir de su HTML con lxml, sin más llamadas al navegador"""
+        try:
+            from lxml import etree
+            from lxml import html as lxml_html
+        except ImportError:
+            return None
+            
+        try:
+            root = lxml_html.fromstring(row_html)
+        except Exception as e:
+            logger.debug("No se pudo analizar el HTML de la fila con lxml: %s", e)
+            return None
+            
+        def evaluate(selector):
+            compiled = XPATH_CACHE.get(selector)
+            if compiled is None:
+                compiled = etree.XPath(selector)
+                XPATH_CACHE[selector] = compiled
+            return compiled(root)
+        
+        # Título: primer selector con texto (o atributo) no vacío, en orden de prioridad
+        title = None
+        for selector, attribute in self.TITLE_XPATHS:
+            nodes = evaluate(selector)
+            if nodes:
+                value = nodes[0].get(attribute) if attribute else nodes[0].text_content()
+                if value and value.strip():
+                    title = value.strip()
+                    break
+        
+        cells = []
+        for selector in self.CELL_XPATHS:
+            found = evaluate(selector)
+            if len(found) > 1:
+                cells = found
+                break
+                
+        # Sin celdas reconocibles: el resto de campos queda para los extractores individuales
+        if not cells:
+            return {"Title": title}
+            
+        cell_texts = [cell.text_content().strip() for cell in cells]
+        
+        def cell_text(position):
+            return cell_texts[position] if len(cell_texts) > position else ""
+        
+        priority = self._normalize_priority(cell_text(2)) or self._priority_from_html(row_html)
+        
+        # text_content() no tiene los saltos de línea renderizados: el estado es el texto del
+        # ObjectStatus o, si no lo hay, el primer fragmento de texto no vacío de la celda
+        status = ""
+        if len(cells) > 3:
+            status_nodes = cells[3].xpath(".//*[contains(@class, 'sapMObjStatusText')]")
+            fragments = status_nodes[0].itertext() if status_nodes else cells[3].itertext()
+            status = next((fragment.strip() for fragment in fragments if fragment.strip()), "")
+        status = status.replace("Object Status", "").strip()
+        status = status.replace("Entry successfully validated", "").strip()
+        
+        return {
+            "Title": title,
+            "Type": cell_text(1),
+            "Priority": priority or None,  # None: probar color y texto en el navegador
+            "Status": self._normalize_status(status),
+            "Deadline": cell_text(4),
+            "Due Date": cell_text(5),
+            "Created By": cell_text(6),
+            "Created On": cell_text(7)
+        }
+    
+    @staticmethod
+    def _bulk_value(row_data, field, fallback, *args):
+        """Devuelve el campo extraído por JavaScript o recurre al extractor individual"""
+        if row_data:
+            value = row_data.get(field)
+            if value is not None:
+                return value
+        return fallback(*args)
+
     def _extract_title(self, row):
         """Extrae el título de una fila"""
         try:
-            # Intentar múltiples métodos para extraer título
-            title_extractors = [
-                lambda r: r.find_element(By.XPATH, ".//a").text,
-                lambda r: r.find_element(By.XPATH, ".//span[contains(@class, 'title')]").text,
-                lambda r: r.find_element(By.XPATH, ".//div[contains(@class, 'title')]").text,
-                lambda r: r.find_elements(By.XPATH, ".//div[@role='gridcell']")[0].text if r.find_elements(By.XPATH, ".//div[@role='gridcell']") else None,
-                lambda r: r.find_elements(By.XPATH, ".//td")[0].text if r.find_elements(By.XPATH, ".//td") else None,
-                lambda r: r.find_element(By.XPATH, ".//*[contains(@id, 'title')]").text,
-                lambda r: r.find_element(By.XPATH, ".//div[@title]").get_attribute("title"),
-                lambda r: r.find_element(By.XPATH, ".//span[@title]").get_attribute("title")
-            ]
-
-            for extractor in title_extractors:
-                try:
-                    title_text = extractor(row)
-                    if title_text and title_text.strip():
-                        return title_text.strip()
-                except:
-                    continue
+            # Evaluar todos los selectores de título en el navegador con una sola llamada,
+            # respetando su orden de prioridad y devolviendo la primera coincidencia
+            title_text = self.driver.execute_script("""
+                var row = arguments[0], selectors = arguments[1];
+                for (var i = 0; i < selectors.length; i++) {
+                    var node = document.evaluate(selectors[i][0], row, null,
+                        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                    if (!node) continue;
+                    var value = selectors[i][1] ? node.getAttribute(selectors[i][1]) : node.innerText;
+                    if (value && value.trim()) return value.trim();
+                }
+                return null;
+            """, row, self.TITLE_XPATHS)
+            
+            if title_text:
+                return title_text
             
             # Si no encontramos un título específico, usar el texto completo
             try:
                 full_text = row.text.strip()
                 if full_text:
-                    lines = full_text.split('\n')
-                    if lines:
-                        title = lines[0].strip()
-                        if len(title) > 100:  # Si es muy largo, recortar
-                            title = title[:100] + "..."
-                        return title
+                    title = full_text.partition('\n')[0].strip()
+                    if len(title) > 100:  # Si es muy largo, recortar
+                        title = title[:100] + "..."
+                    return title
             except:
                 pass
                 
             return None
         except Exception as e:
-            logger.debug(f"Error al extraer título: {e}")
+            logger.debug("Error al extraer título: %s", e)
             return None
     
     
@@ -1352,11 +2746,9 @@ class SAPBrowser:
             type_cells = []
             
             # Buscar en la segunda columna específicamente
-            cells = self._get_row_cells(row)
-            if cells and len(cells) >= 2:
-                type_text = cells[1].text.strip()
-                if type_text:
-                    return type_text
+            type_text = self._cell_text(row, 1)
+            if type_text:
+                return type_text
             
             # Intentar con selectores UI5 específicos
             ui5_types = self.find_ui5_elements("sap.m.Label", {"text": "Type"})
@@ -1364,8 +2756,9 @@ class SAPBrowser:
                 try:
                     # Buscar el elemento de valor asociado
                     value_element = self.driver.find_element(By.XPATH, f"./following-sibling::*[1]")
-                    if value_element and value_element.text:
-                        return value_element.text.strip()
+                    value_text = value_element.text if value_element else ""
+                    if value_text:
+                        return value_text.strip()
                 except:
                     pass
             
@@ -1381,181 +2774,238 @@ class SAPBrowser:
             # Devolver un valor por defecto coherente
             return ""  # Vacío en lugar de "Issue" como estaba antes
         except Exception as e:
-            logger.debug(f"Error al extraer tipo: {e}")
+            logger.debug("Error al extraer tipo: %s", e)
             return ""
 
     def _extract_priority(self, row):
         """Extrae la prioridad del issue - Corregido"""
         try:
             # Buscar en la tercera columna específicamente
-            cells = self._get_row_cells(row)
-            if cells and len(cells) >= 3:
-                priority_text = cells[2].text.strip()
-                if priority_text:
-                    # Normalizar el texto de prioridad
-                    return self._normalize_priority(priority_text)
-            
-            # Buscar indicadores de prioridad
-            priority_indicators = [
-                (By.XPATH, ".//span[contains(@class, 'sapMGaugeNegativeColor')]", "Very High"),
-                (By.XPATH, ".//span[contains(@class, 'sapMGaugeCriticalColor')]", "High"),
-                (By.XPATH, ".//span[contains(@class, 'sapMGaugeNeutralColor')]", "Medium"),
-                (By.XPATH, ".//span[contains(@class, 'sapMGaugePositiveColor')]", "Low"),
-                (By.XPATH, ".//span[contains(text(), 'Very High')]", "Very High"),
-                (By.XPATH, ".//span[contains(text(), 'High')]", "High"),
-                (By.XPATH, ".//span[contains(text(), 'Medium')]", "Medium"),
-                (By.XPATH, ".//span[contains(text(), 'Low')]", "Low")
-            ]
-            
-            for locator, indicator_text in priority_indicators:
-                elements = row.find_elements(locator)
-                if elements:
-                    return indicator_text
+            priority_text = self._cell_text(row, 2)
+            if priority_text:
+                # Normalizar el texto de prioridad
+                return self._normalize_priority(priority_text)
             
-            return ""  # Vacío si no se encuentra
+            # Clasificar en el navegador con una sola llamada: primero por el color calculado
+            # del indicador, luego por su clase y por último por el texto de los spans;
+            # el script devuelve solo la etiqueta, sin transferir elementos ni listas de textos
+            try:
+                return self.driver.execute_script("""
+                    var row = arguments[0], classLabels = arguments[1], colorLabels = arguments[2];
+                    var textLabels = arguments[3];
+                    var gauge = row.querySelector("[class*='sapMGauge'][class*='Color']");
+                    if (gauge) {
+                        var color = getComputedStyle(gauge).color;
+                        if (colorLabels.hasOwnProperty(color)) return colorLabels[color];
+                    }
+                    for (var i = 0; i < classLabels.length; i++) {
+                        if (row.querySelector("span." + classLabels[i][0])) return classLabels[i][1];
+                    }
+                    var spans = row.querySelectorAll("span"), texts = [];
+                    for (var j = 0; j < spans.length; j++) {
+                        var text = "";
+                        for (var node = spans[j].firstChild; node; node = node.nextSibling) {
+                            if (node.nodeType === 3) text += node.nodeValue;
+                        }
+                        texts.push(text);
+                    }
+                    var joined = texts.join("\\n");
+                    for (var k = 0; k < textLabels.length; k++) {
+                        if (joined.indexOf(textLabels[k]) !== -1) return textLabels[k];
+                    }
+                    return "";
+                """, row, list(PRIORITY_CLASS_LABELS.items()), PRIORITY_COLOR_LABELS, PRIORITY_TEXT_LABELS) or ""
+            except JavascriptException as e:
+                # Respaldo: una sola lectura del HTML de la fila y clasificación por clase con regex
+                logger.debug("Clasificación de prioridad en el navegador falló, usando outerHTML: %s", e)
+                return self._priority_from_html(row.get_attribute("outerHTML") or "")
         except Exception as e:
-            logger.debug(f"Error al extraer prioridad: {e}")
+            logger.debug("Error al extraer prioridad: %s", e)
             return ""
         
-    def _normalize_priority(self, priority_text):
+    @staticmethod
+    def _priority_from_html(row_html):
+        """Clasifica la prioridad a partir de las clases de indicador presentes en el HTML de la fila"""
+        found = set(PRIORITY_CLASS_PATTERN.findall(row_html))
+        for indicator_class, label in PRIORITY_CLASS_LABELS.items():
+            if indicator_class in found:
+                return label
+        return ""
+    
+    @classmethod
+    def _normalize_priority(cls, priority_text):
         """Normaliza el texto de prioridad"""
         if not priority_text:
             return ""
             
-        priority_lower = priority_text.lower()
-        
-        if "very high" in priority_lower:
-            return "Very High"
-        elif "high" in priority_lower:
-            return "High"
-        elif "medium" in priority_lower:
-            return "Medium"
-        elif "low" in priority_lower:
-            return "Low"
-        
-        return priority_text
+        return cls._match_priority_label(priority_text, PRIORITY_TEXT_PATTERN_NOCASE) or priority_text
+    
+    @staticmethod
+    def _match_priority_label(text, pattern):
+        """Devuelve la etiqueta de prioridad más específica encontrada en el texto con una sola búsqueda"""
+        found = {match.title() for match in pattern.findall(text)}
+        for label in PRIORITY_TEXT_LABELS:
+            if label in found:
+                return label
+        return None
+
+    @staticmethod
+    def _normalize_status(status_text):
+        """Normaliza el texto de estado a valores estándar"""
+        if not status_text:
+            return ""
+            
+        # Camino rápido: el texto ya es exactamente un estado conocido
+        exact = STATUS_EXACT_MATCHES.get(status_text.upper())
+        if exact:
+            return exact
+            
+        # Buscar todas las palabras clave en una sola pasada y aplicar la regla de mayor precedencia
+        found = {match.upper() for match in STATUS_KEYWORD_PATTERN.findall(status_text)}
+        if found:
+            for keywords, canonical in STATUS_RULES:
+                if all(keyword in found for keyword in keywords):
+                    return canonical
+            
+        return status_text
 
     def _extract_status(self, row):
         """Extrae el estado del issue - Corregido"""
         try:
             # Buscar en la cuarta columna específicamente
-            cells = self._get_row_cells(row)
-            if cells and len(cells) >= 4:
-                status_text = cells[3].text.strip()
-                if status_text:
-                    # Extraer solo la primera línea (evitar "Object Status" y textos adicionales)
-                    status_lines = status_text.split("\n")
-                    if status_lines:
-                        # Limpiar el texto de estado
-                        status = status_lines[0].strip()
-                        
-                        # Eliminar textos adicionales no deseados
-                        status = status.replace("Object Status", "").strip()
-                        status = status.replace("Entry successfully validated", "").strip()
-                        
-                        return self._normalize_status(status)
+            status_text = self._cell_text(row, 3)
+            if status_text:
+                # Extraer solo la primera línea (evitar "Object Status" y textos adicionales)
+                status = status_text.partition("\n")[0].strip()
+                
+                # Eliminar textos adicionales no deseados
+                status = status.replace("Object Status", "").strip()
+                status = status.replace("Entry successfully validated", "").strip()
+                
+                return self._normalize_status(status)
             
+            # Sin columna de estado: leer en una sola llamada el texto de los controles
+            # ObjectStatus de la fila y quedarse con el primero que contenga un estado conocido
+            status_texts = self.driver.execute_script("""
+                var nodes = arguments[0].querySelectorAll(".sapMObjStatus, [class*='Status']");
+                return Array.prototype.map.call(nodes, function(node) {
+                    return (node.innerText || "").split("\\n")[0].trim();
+                });
+            """, row)
+            for status in status_texts:
+                if STATUS_KEYWORD_PATTERN.search(status):
+                    return self._normalize_status(status)
+        
             return ""
         except Exception as e:
-            logger.debug(f"Error al extraer estado: {e}")
+            logger.debug("Error al extraer estado: %s", e)
             return ""
         
     def _extract_deadline(self, row):
         """Extrae la fecha límite del issue - Corregido"""
-        try:
-            # Buscar en la quinta columna específicamente
-            cells = self._get_row_cells(row)
-            if cells and len(cells) >= 5:
-                deadline_text = cells[4].text.strip()
-                if deadline_text:
-                    return deadline_text
-            
-            return ""
-        except Exception as e:
-            logger.debug(f"Error al extraer deadline: {e}")
-            return ""
+        # Buscar en la quinta columna específicamente
+        return self._cell_text(row, 4)
         
     def _extract_due_date(self, row):
         """Extrae la fecha de vencimiento del issue - Corregido"""
-        try:
-            # Buscar en la sexta columna específicamente
-            cells = self._get_row_cells(row)
-            if cells and len(cells) >= 6:
-                due_date_text = cells[5].text.strip()
-                if due_date_text:
-                    return due_date_text
-            
-            return ""
-        except Exception as e:
-            logger.debug(f"Error al extraer due date: {e}")
-            return ""
+        # Buscar en la sexta columna específicamente
+        return self._cell_text(row, 5)
         
     def _extract_created_by(self, row):
         """Extrae quién creó el issue - Corregido"""
-        try:
-            # Buscar en la séptima columna específicamente
-            cells = self._get_row_cells(row)
-            if cells and len(cells) >= 7:
-                created_by_text = cells[6].text.strip()
-                if created_by_text:
-                    return created_by_text
-            
-            return ""
-        except Exception as e:
-            logger.debug(f"Error al extraer creador: {e}")
-            return ""
+        # Buscar en la séptima columna específicamente
+        return self._cell_text(row, 6)
         
     def _extract_created_on(self, row):
         """Extrae la fecha de creación del issue - Corregido"""
-        try:
-            # Buscar en la octava columna específicamente
-            cells = self._get_row_cells(row)
-            if cells and len(cells) >= 8:
-                created_on_text = cells[7].text.strip()
-                if created_on_text:
-                    return created_on_text
-            
-            return ""
-        except Exception as e:
-            logger.debug(f"Error al extraer fecha de creación: {e}")
-            return ""
+        # Buscar en la octava columna específicamente
+        return self._cell_text(row, 7)
         
         
         
         
         
         
+    def _cell_text(self, row, position):
+        """Devuelve el texto de la celda indicada, leyendo todas las celdas de la fila en una sola llamada"""
+        cell_texts = self._get_row_cell_texts(row)
+        if cell_texts:
+            return cell_texts[position].strip() if len(cell_texts) > position else ""
+            
+        # Respaldo: búsqueda de celdas con Selenium (incluye el enfoque personalizado)
+        cells = self._get_row_cells(row)
+        if cells and len(cells) > position:
+            try:
+                # innerText conserva los saltos de línea renderizados, de los que depende
+                # _extract_status para descartar los textos secundarios de la celda
+                return (cells[position].get_attribute("innerText") or "").strip()
+            except WebDriverException as e:
+                logger.debug("Error al leer la celda %s: %s", position, e)
+        return ""
+    
+    def _get_row_cell_texts(self, row):
+        """Obtiene el texto de todas las celdas de una fila con un único execute_script, con caché por fila"""
+        row_key = row.id
+        with self._row_cache_lock:
+            if row_key in self._row_texts_cache:
+                return self._row_texts_cache[row_key]
+            
+        try:
+            cell_texts = self.driver.execute_script("""
+                var row = arguments[0], strategies = arguments[1];
+                for (var i = 0; i < strategies.length; i++) {
+                    var found = row.querySelectorAll(strategies[i]);
+                    if (found.length > 1) {
+                        return Array.prototype.map.call(found, function(cell) {
+                            return cell.innerText || "";
+                        });
+                    }
+                }
+                return [];
+            """, row, self.CELL_SELECTORS)
+        except Exception as e:
+            logger.debug("Error al leer las celdas con JavaScript: %s", e)
+            cell_texts = []
+            
+        with self._row_cache_lock:
+            self._row_texts_cache[row_key] = cell_texts
+        return cell_texts
+    
     def _get_row_cells(self, row):
+        """Obtiene las celdas de una fila, reutilizando el resultado si la fila ya se consultó"""
+        row_key = row.id
+        with self._row_cache_lock:
+            if row_key in self._row_cell_cache:
+                return self._row_cell_cache[row_key]
+                
+        # La consulta al navegador se hace fuera del bloqueo para no serializar los hilos
+        cells = self._find_row_cells(row)
+        with self._row_cache_lock:
+            self._row_cell_cache[row_key] = cells
+        return cells
+    
+    def _find_row_cells(self, row):
         """Método mejorado para obtener todas las celdas de una fila"""
         cells = []
         
         try:
-            # Intentar diferentes métodos para obtener celdas en orden de prioridad
-            cell_extractors = [
-                # 1. Buscar elementos td directamente (tabla HTML estándar)
-                lambda r: r.find_elements(By.XPATH, ".//td"),
-                
-                # 2. Buscar celdas específicas de SAP UI5
-                lambda r: r.find_elements(By.XPATH, ".//div[@role='gridcell']"),
-                
-                # 3. Buscar cualquier div hijo directo como posible celda
-                lambda r: r.find_elements(By.XPATH, "./div"),
-                
-                # 4. Buscar elementos con clases que indiquen que son celdas
-                lambda r: r.find_elements(By.XPATH, ".//*[contains(@class, 'cell') or contains(@class, 'Cell')]"),
+            # Probar las estrategias de celdas en el navegador con una sola llamada,
+            # en el mismo orden de prioridad, y devolver la primera con más de una celda
+            try:
+                extracted_cells = self.driver.execute_script("""
+                    var row = arguments[0], strategies = arguments[1];
+                    for (var i = 0; i < strategies.length; i++) {
+                        var found = row.querySelectorAll(strategies[i]);
+                        if (found.length > 1) return Array.prototype.slice.call(found);
+                    }
+                    return [];
+                """, row, self.CELL_SELECTORS)
+            except Exception as e:
+                logger.debug("Error al buscar celdas con JavaScript: %s", e)
+                extracted_cells = []
                 
-                # 5. Buscar spans que puedan ser celdas
-                lambda r: r.find_elements(By.XPATH, ".//span[contains(@id, 'col')]")
-            ]
-            
-            # Intentar cada método hasta encontrar celdas
-            for extractor in cell_extractors:
-                try:
-                    extracted_cells = extractor(row)
-                    if extracted_cells and len(extracted_cells) > 1:
-                        return extracted_cells
-                except:
-                    continue
+            if extracted_cells:
+                return extracted_cells
                     
             # Si no encontramos con los métodos anteriores, intentar un enfoque más personalizado
             # para la estructura vista en la captura de pantalla
@@ -1564,11 +3014,16 @@ class SAPBrowser:
                     # Obtener todos los elementos que podrían contener datos en la fila
                     all_cells = row.find_elements(By.XPATH, ".//*[normalize-space(text())]")
                     
-                    # Filtrar elementos que parecen ser celdas basándonos en su posición y contenido
+                    # Filtrar elementos que parecen ser celdas basándonos en su posición y contenido,
+                    # leyendo las clases de todos los candidatos en una sola llamada
+                    cell_classes = self.driver.execute_script(
+                        "return arguments[0].map(function(cell) { return cell.getAttribute('class') || ''; });",
+                        all_cells
+                    ) if all_cells else []
                     filtered_cells = []
-                    for cell in all_cells:
+                    for cell, cell_class in zip(all_cells, cell_classes):
                         # Ignorar elementos anidados profundamente o elementos de UI
-                        if not any(s in cell.get_attribute("class") or "" for s in ["icon", "button", "checkbox"]):
+                        if not any(s in cell_class for s in ["icon", "button", "checkbox"]):
                             filtered_cells.append(cell)
                     
                     # Si tenemos al menos 4 celdas potenciales, usarlas
@@ -1577,7 +3032,7 @@ class SAPBrowser:
                 except:
                     pass
         except Exception as e:
-            logger.debug(f"Error al extraer celdas: {e}")
+            logger.debug("Error al extraer celdas: %s", e)
         
         return cells
     
@@ -1627,49 +3082,23 @@ class SAPBrowser:
 
     def find_ui5_elements(self, control_type, properties=None):
         """Encuentra elementos UI5 específicos usando JavaScript"""
-        script = """
-        function findUI5Controls(controlType, properties) {
-            if (!window.sap || !window.sap.ui) return [];
-            
-            var controls = sap.ui.getCore().byFieldGroupId().filter(function(control) {
-                return control.getMetadata().getName() === controlType;
-            });
-            
-            if (properties) {
-                controls = controls.filter(function(control) {
-                    for (var prop in properties) {
-                        if (control.getProperty(prop) !== properties[prop]) {
-                            return false;
-                        }
-                    }
-                    return true;
-                });
-            }
-            
-            return controls.map(function(control) {
-                return control.getId();
-            });
-        }
-        return findUI5Controls(arguments[0], arguments[1]);
-        """
-        
         try:
-            control_ids = self.driver.execute_script(script, control_type, properties)
-            elements = []
-            
-            for control_id in control_ids:
-                try:
-                    element = self.driver.find_element(By.ID, control_id)
-                    elements.append(element)
-                except:
-                    pass
-                    
-            return elements
+            # El script devuelve directamente los elementos DOM: una sola llamada en lugar
+            # de un find_element por cada ID de control
+            return self.driver.execute_script(self.UI5_CONTROLS_SCRIPT, control_type, properties) or []
         except:
             return []
     
     def close(self):
         """Cierra el navegador"""
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"Error al detener Playwright: {e}")
+            self._playwright = None
+            self._playwright_page = None
+            
         if self.driver:
             try:
                 self.driver.quit()
@@ -1684,8 +3113,63 @@ class SAPBrowser:
 
 
 
+def _scrape_odata_page_range(job):
+    """Proceso de trabajo: descarga un rango de páginas OData con su propio navegador headless"""
+    odata_url, cookies, skips, page_size = job
+    
+    # Devuelve (issues, error): un fallo no debe descartar lo descargado por los demás procesos
+    issues = []
+    driver = None
+    try:
+        chrome_options = Options()
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--disable-gpu")
+        driver = webdriver.Chrome(options=chrome_options)
+        
+        # Reutilizar la sesión autenticada del navegador principal
+        parts = urlsplit(odata_url)
+        driver.get(urlunsplit((parts.scheme, parts.netloc, "/", "", "")))
+        for cookie in cookies:
+            cookie.pop("sameSite", None)
+            driver.add_cookie(cookie)
+            
+        for skip in skips:
+            query = dict(parse_qsl(parts.query))
+            query.update({"$skip": str(skip), "$top": str(page_size), "$format": "json"})
+            page_url = urlunsplit(parts._replace(query=urlencode(query)))
+            driver.get(page_url)
+            
+            payload = json.loads(driver.find_element(By.TAG_NAME, "body").text)
+            # Conversión sin instanciar SAPBrowser (ni sus estadísticas de selectores)
+            page_issues = SAPBrowser._odata_payload_to_keyed_issues(payload, page_url)
+            issues.extend(page_issues)
+            
+            if len(page_issues) < page_size:
+                break  # Última página alcanzada
+                
+        return issues, None
+    except Exception as e:
+        return issues, f"{type(e).__name__}: {e}"
+    finally:
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+
+
+
 class IssuesExtractor:
     """Clase principal para extraer issues de SAP con interfaz gráfica y base de datos"""
+    
+    # Tamaño inicial de la ventana principal
+    WINDOW_WIDTH = 650
+    WINDOW_HEIGHT = 800
+    
+    # Espera antes de escribir la configuración, para agrupar cambios seguidos en una sola escritura
+    CONFIG_SAVE_DELAY_MS = 300
 
     def __init__(self):
         """Inicializa la clase"""
@@ -1706,6 +3190,14 @@ class IssuesExtractor:
         self.client_combo = None
         self.image_cache = {}
         
+        # Configuración: el directorio se crea una sola vez y se recuerda lo último guardado
+        config_dir = "config"
+        if not os.path.exists(config_dir):
+            os.makedirs(config_dir)
+        self.config_path = os.path.join(config_dir, 'config.json')
+        self._last_config_json = None
+        self._save_config_after = None
+        
         # Componentes
         self.db_manager = DatabaseManager()
         self.excel_manager = ExcelManager()
@@ -1845,10 +3337,7 @@ class IssuesExtractor:
             
             # Estrategia 1: Buscar el texto "Issues (número)"
             try:
-                issues_title_elements = self.driver.find_elements(
-                    By.XPATH, 
-                    "//div[contains(text(), 'Issues') and contains(text(), '(')]"
-                )
+                issues_title_elements = self.driver.find_elements(By.XPATH, ISSUES_TITLE_XPATH)
                 if issues_title_elements:
                     logger.info(f"Página de Issues detectada por título: {issues_title_elements[0].text}")
                     in_issues_page = True
@@ -1865,10 +3354,7 @@ class IssuesExtractor:
             # Estrategia 3: Verificar encabezados de columna típicos
             if not in_issues_page:
                 try:
-                    column_headers = self.driver.find_elements(
-                        By.XPATH,
-                        "//div[text()='Title'] | //div[text()='Type'] | //div[text()='Priority'] | //div[text()='Status']"
-                    )
+                    column_headers = self.driver.find_elements(By.XPATH, ISSUES_COLUMN_HEADERS_XPATH)
                     if len(column_headers) >= 3:
                         logger.info(f"Se detectaron encabezados de columna típicos de issues: {len(column_headers)}")
                         in_issues_page = True
@@ -1879,35 +3365,25 @@ class IssuesExtractor:
             if not in_issues_page:
                 logger.warning("No se detectó la página de Issues. Intentando hacer clic en la pestaña...")
                 
-                tab_selectors = [
-                    "//div[@role='tab' and contains(text(), 'Issues')]",
-                    "//a[contains(text(), 'Issues')]",
-                    "//li[contains(@class, 'tab') and contains(., 'Issues')]",
-                    "//div[contains(@class, 'sapMITBItem') and contains(., 'Issues')]",
-                    "//div[contains(@class, 'sapMITBItem')]//span[contains(text(), 'Issues')]/..",
-                    "//*[contains(text(), 'Issues') and not(contains(text(), '('))]"
-                ]
-                
                 issue_tab_found = False
-                for selector in tab_selectors:
+                for selector in ISSUES_TAB_SELECTORS:
                     try:
                         issue_tabs = self.driver.find_elements(By.XPATH, selector)
                         if issue_tabs:
                             for tab in issue_tabs:
                                 try:
                                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab)
-                                    time.sleep(1)
                                     
                                     try:
                                         self.driver.execute_script("arguments[0].click();", tab)
                                         logger.info(f"Clic en pestaña Issues realizado con JavaScript: {tab.text}")
-                                        time.sleep(3)
+                                        self.browser.wait_until_ready(timeout=3)
                                         issue_tab_found = True
                                         break
                                     except:
                                         tab.click()
                                         logger.info(f"Clic en pestaña Issues realizado: {tab.text}")
-                                        time.sleep(3)
+                                        self.browser.wait_until_ready(timeout=3)
                                         issue_tab_found = True
                                         break
                                 except Exception as click_e:
@@ -1921,9 +3397,7 @@ class IssuesExtractor:
                 
                 if issue_tab_found:
                     try:
-                        issues_title_elements = self.driver.find_elements(
-                            By.XPATH, "//div[contains(text(), 'Issues') and contains(text(), '(')]"
-                        )
+                        issues_title_elements = self.driver.find_elements(By.XPATH, ISSUES_TITLE_XPATH)
                         if issues_title_elements:
                             logger.info(f"Página de Issues detectada después de clic: {issues_title_elements[0].text}")
                             in_issues_page = True
@@ -2037,8 +3511,20 @@ class IssuesExtractor:
     def create_gui(self):
         """Crea una interfaz gráfica mejorada para la aplicación"""
         self.root = tk.Tk()
+        # Mantener la ventana oculta mientras se construyen los widgets para que la
+        # geometría se calcule una sola vez al final en lugar de tras cada widget
+        self.root.withdraw()
+        
+        # Resolver cada fuente una sola vez con una etiqueta oculta que la mantiene en uso,
+        # para que los widgets siguientes reutilicen la fuente ya cargada por Tk
+        self._font_primers = [tk.Label(self.root, font=font) for font in GUI_FONTS]
+        
         self.root.title("SAP Recommendations Extractor")
-        self.root.geometry("650x800")
+        # Tamaño fijo conocido y centrado en la pantalla, sin consultar la geometría actual a Tk
+        screen_width = self.root.winfo_screenwidth()
+        screen_height = self.root.winfo_screenheight()
+        self.root.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}"
+                           f"+{(screen_width - self.WINDOW_WIDTH) // 2}+{(screen_height - self.WINDOW_HEIGHT) // 2}")
         self.root.resizable(True, True)
         self.root.configure(bg=SAP_COLORS["light"])
         
@@ -2072,19 +3558,33 @@ class IssuesExtractor:
             
         # Configurar estilo
         style = ttk.Style()
+        # "clam" respeta los colores de fondo definidos en los estilos (los temas nativos los ignoran)
+        style.theme_use("clam")
         style.configure('TCombobox', arrowsize=15)
         
         # Estilos para widgets
         style.configure(".", foreground=SAP_COLORS["text"])
-        style.configure("TLabel", background=SAP_COLORS["light"], foreground=SAP_COLORS["text"], font=("Arial", 10, "bold"))
+        style.configure("TLabel", background=SAP_COLORS["light"], foreground=SAP_COLORS["text"], font=FONT_BODY_BOLD)
         style.configure("Header.TLabel", background=SAP_COLORS["light"], foreground=SAP_COLORS["secondary"], font=("Arial", 16, "bold"))
-        style.configure("TLabelframe.Label", background=SAP_COLORS["light"], foreground=SAP_COLORS["text"], font=("Arial", 11, "bold"))
-        style.configure("Primary.TButton", background=SAP_COLORS["primary"], foreground=SAP_COLORS["white"], font=("Arial", 10, "bold"))
-        style.configure("Success.TButton", background=SAP_COLORS["success"], foreground=SAP_COLORS["white"], font=("Arial", 10, "bold"))
-        style.configure("Danger.TButton", background=SAP_COLORS["danger"], foreground=SAP_COLORS["white"], font=("Arial", 10, "bold"))
+        style.configure("TLabelframe.Label", background=SAP_COLORS["light"], foreground=SAP_COLORS["text"], font=FONT_SECTION)
+        for button_style, (background, active_background) in ACTION_BUTTON_COLORS.items():
+            style.configure(button_style, background=background, foreground=SAP_COLORS["white"],
+                            font=FONT_BODY_BOLD, padding=(10, 5))
+            style.map(button_style, background=[("active", active_background)],
+                      foreground=[("active", SAP_COLORS["white"])])
         style.configure("TCombobox", selectbackground=SAP_COLORS["primary"], selectforeground=SAP_COLORS["white"], 
                         fieldbackground="white", background="white", foreground=SAP_COLORS["text"])
         
+        # Estilos de la ventana principal: se configuran una vez y cada widget solo indica su estilo
+        style.configure("SAP.Title.TLabel", background="#0A3D6E", foreground="#FFFFFF", font=FONT_TITLE, padding=(8, 4))
+        style.configure("SAP.Body.TLabel", background=SAP_COLORS["light"], foreground="#000000", font=FONT_BODY)
+        style.configure("SAP.Small.TLabel", background=SAP_COLORS["light"], foreground="#000000", font=FONT_SMALL)
+        style.configure("SAP.File.TLabel", background=SAP_COLORS["light"], foreground="#0A3D6E", font=FONT_SMALL_BOLD)
+        style.configure("SAP.Status.TLabel", background="#F0F0F0", foreground="#000000", font=FONT_BODY,
+                        relief=tk.SUNKEN, padding=(5, 2))
+        style.configure("SAP.TLabelframe", background=SAP_COLORS["light"])
+        style.configure("SAP.TLabelframe.Label", background=SAP_COLORS["light"], foreground="#000000", font=FONT_SECTION)
+        
         # Frame principal
         main_frame = ttk.Frame(self.root, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -2102,18 +3602,11 @@ class IssuesExtractor:
         except:
             pass
         
-        # Título con fondo de alto contraste
-        title_background = "#0A3D6E"  # Azul oscuro
-        title_foreground = "#FFFFFF"  # Texto blanco
-        
-        title_label = tk.Label(
+        # Título con fondo de alto contraste (azul oscuro y texto blanco)
+        title_label = ttk.Label(
             self.header_frame, 
             text="Extractor de Recomendaciones SAP",
-            font=("Arial", 18, "bold"),
-            foreground=title_foreground,
-            background=title_background,
-            padx=8,
-            pady=4
+            style="SAP.Title.TLabel"
         )
         title_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
@@ -2127,91 +3620,116 @@ class IssuesExtractor:
         self.left_panel.pack_propagate(False)  # Mantener ancho fijo
         
         # Sección de cliente
-        client_frame = tk.LabelFrame(self.left_panel, 
-                                text="Cliente", 
-                                bg=SAP_COLORS["light"],
-                                fg="#000000",
-                                font=("Arial", 11, "bold"),
-                                padx=10, pady=10)
+        client_frame = ttk.LabelFrame(self.left_panel, text="Cliente", style="SAP.TLabelframe", padding=10)
         client_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Etiqueta ERP
-        tk.Label(client_frame, 
-            text="ERP Number:",
-            bg=SAP_COLORS["light"],
-            fg="#000000",
-            font=("Arial", 9)).grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
+        ttk.Label(client_frame, text="ERP Number:", style="SAP.Small.TLabel").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
         
         # Entry ERP
         self.client_var = tk.StringVar(value="1025541")
-        client_entry = tk.Entry(client_frame, 
-                            textvariable=self.client_var,
-                            width=15,
-                            font=("Arial", 10),
-                            bg="white",
-                            fg="black",
-                            highlightbackground=SAP_COLORS["primary"],
-                            highlightcolor=SAP_COLORS["primary"])
+        client_entry = tk.Entry(client_frame, textvariable=self.client_var, **ENTRY_OPTIONS)
         client_entry.grid(row=0, column=1, padx=5, pady=5, sticky=tk.W)
         
         # Etiqueta de clientes guardados
-        tk.Label(client_frame, 
-            text="Clientes guardados:",
-            bg=SAP_COLORS["light"],
-            fg="#000000",
-            font=("Arial", 9)).grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
+        ttk.Label(client_frame, text="Clientes guardados:", style="SAP.Small.TLabel").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
         
         # Lista desplegable de clientes guardados
         client_list = self.db_manager.get_clients()
         self.client_combo = ttk.Combobox(client_frame, values=client_list, width=30)
         self.client_combo.config(state='readonly')
         self.client_combo.grid(row=1, column=1, columnspan=2, padx=5, pady=5, sticky=tk.W+tk.E)
-        self.client_combo.bind("<<ComboboxSelected>>", lambda e: self.select_client(self.client_combo.get()))
-
-        # Sección de proyecto
-        project_frame = tk.LabelFrame(self.left_panel, 
-                                    text="Proyecto", 
-                                    bg=SAP_COLORS["light"],
-                                    fg="#000000",
-                                    font=("Arial", 11, "bold"),
-                                    padx=10, pady=10)
+        self.client_combo.bind("<<ComboboxSelected>>", self._on_client_selected)
+
+        # Variables de las secciones diferidas: se crean ya para que load_config pueda asignarlas
+        self.project_var = tk.StringVar(value="20096444")
+        self.excel_filename_var = tk.StringVar(value="No seleccionado")
+        
+        # Las demás secciones del panel izquierdo se construyen cuando la ventana ya
+        # está visible (o antes, si la selección de cliente necesita la de proyecto)
+        self._section_builders = OrderedDict([
+            ("project", self._build_project_section),
+            ("browser", self._build_browser_section),
+            ("excel", self._build_excel_section),
+            ("action", self._build_action_section),
+        ])
+        self._built_sections = set()
+        
+        # Panel derecho para logs
+        right_panel = ttk.Frame(content_frame, padding=10, width=300)
+        right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        right_panel.pack_propagate(False)
+        
+        # Log frame
+        log_frame = ttk.LabelFrame(right_panel, text="Registro de Actividad", style="SAP.TLabelframe")
+        log_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Text widget para logs
+        self.log_text = tk.Text(
+            log_frame, 
+            height=20, 
+            wrap=tk.WORD, 
+            bg="white",
+            fg="black",
+            font=FONT_LOG,
+            padx=5,
+            pady=5,
+            borderwidth=2,
+            relief=tk.SUNKEN,
+            undo=False,  # El log no se edita: sin pila de deshacer ni separadores por inserción
+            maxundo=0,
+            autoseparators=False
+        )
+        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Colores para los logs
+        self.log_text.tag_configure("INFO", foreground="black")
+        self.log_text.tag_configure("WARNING", foreground="#CC6600")
+        self.log_text.tag_configure("ERROR", foreground="#990000")
+        self.log_text.tag_configure("DEBUG", foreground="#555555")
+        
+        # Scrollbar para el log
+        scrollbar = ttk.Scrollbar(log_frame, command=self.log_text.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.log_text.config(yscrollcommand=scrollbar.set)
+        
+        # Status bar
+        self.status_var = tk.StringVar(value="Listo para iniciar")
+        status_bar = ttk.Label(
+            self.root, 
+            textvariable=self.status_var,
+            style="SAP.Status.TLabel",
+            anchor=tk.W
+        )
+        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        # Configurar logger para que también escriba en la GUI
+        self.setup_gui_logger()
+        
+        # Manejar cierre de ventana
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
+        
+        # Cargar configuración guardada
+        self.load_config()
+        
+        # Mostrar la ventana ya construida (se centró al fijar su tamaño)
+        self.root.deiconify()
+        self.root.after_idle(self._build_pending_sections)
+    
+    def _build_project_section(self):
+        """Construye la sección de proyecto del panel izquierdo"""
+        project_frame = ttk.LabelFrame(self.left_panel, text="Proyecto", style="SAP.TLabelframe", padding=10)
         project_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Etiqueta ID
-        tk.Label(project_frame, 
-            text="ID Proyecto:",
-            bg=SAP_COLORS["light"],
-            fg="#000000",
-            font=("Arial", 10)).grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
+        ttk.Label(project_frame, text="ID Proyecto:", style="SAP.Body.TLabel").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
         
-
-
-
-
-
-
-
-
-
-
-# Entry Proyecto
-        self.project_var = tk.StringVar(value="20096444")
-        project_entry = tk.Entry(project_frame, 
-                            textvariable=self.project_var,
-                            width=15,
-                            font=("Arial", 10),
-                            bg="white",
-                            fg="black",
-                            highlightbackground=SAP_COLORS["primary"],
-                            highlightcolor=SAP_COLORS["primary"])
+        # Entry Proyecto
+        project_entry = tk.Entry(project_frame, textvariable=self.project_var, **ENTRY_OPTIONS)
         project_entry.grid(row=0, column=1, padx=5, pady=5, sticky=tk.W)
         
         # Etiqueta de proyectos
-        tk.Label(project_frame, 
-            text="Proyectos:",
-            bg=SAP_COLORS["light"],
-            fg="#000000",
-            font=("Arial", 10)).grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
+        ttk.Label(project_frame, text="Proyectos:", style="SAP.Body.TLabel").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
         
         # Lista desplegable de proyectos guardados
         project_list = self.db_manager.get_projects("1025541")  # Proyectos para el cliente predeterminado
@@ -2220,123 +3738,75 @@ class IssuesExtractor:
         self.project_combo.grid(row=1, column=1, columnspan=2, padx=5, pady=5, sticky=tk.W+tk.E)
         self.project_combo.bind("<<ComboboxSelected>>", lambda e: self.select_project(self.project_combo.get()))
 
+    def _build_browser_section(self):
+        """Construye la sección de navegador del panel izquierdo"""
         # Sección de navegador
-        browser_frame = tk.LabelFrame(self.left_panel, 
-                                    text="Navegador", 
-                                    bg=SAP_COLORS["light"],
-                                    fg="#000000",
-                                    font=("Arial", 11, "bold"),
-                                    padx=10, pady=10)
+        browser_frame = ttk.LabelFrame(self.left_panel, text="Navegador", style="SAP.TLabelframe", padding=10)
         browser_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Etiqueta de navegador
-        browser_label = tk.Label(
+        browser_label = ttk.Label(
             browser_frame, 
             text="Iniciar un navegador con perfil dedicado:",
-            bg=SAP_COLORS["light"],
-            fg="#000000",
-            font=("Arial", 10),
+            style="SAP.Body.TLabel",
             anchor="w",
             justify="left"
         )
         browser_label.pack(fill=tk.X, pady=(0, 5))
         
         # Botón de navegador
-        browser_button = tk.Button(
-            browser_frame, 
-            text="Iniciar Navegador",
-            command=self.start_browser,
-            bg=SAP_COLORS["primary"],
-            fg="#FFFFFF",
-            activebackground="#0A3D6E",
-            activeforeground="#FFFFFF",
-            font=("Arial", 10, "bold"),
-            padx=10, pady=5
-        )
+        browser_button = self._create_action_button(browser_frame, "Iniciar Navegador", self.start_browser, "Primary.TButton")
         browser_button.pack(fill=tk.X, pady=5)
-        
+
+    def _build_excel_section(self):
+        """Construye la sección de archivo Excel del panel izquierdo"""
         # Sección de archivo Excel
-        excel_frame = tk.LabelFrame(self.left_panel, 
-                                text="Archivo Excel", 
-                                bg=SAP_COLORS["light"],
-                                fg="#000000",
-                                font=("Arial", 11, "bold"),
-                                padx=10, pady=10)
+        excel_frame = ttk.LabelFrame(self.left_panel, text="Archivo Excel", style="SAP.TLabelframe", padding=10)
         excel_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Etiqueta de Excel
-        excel_label = tk.Label(
+        excel_label = ttk.Label(
             excel_frame, 
             text="Seleccione un archivo existente o cree uno nuevo:",
-            bg=SAP_COLORS["light"],
-            fg="#000000",
-            font=("Arial", 10),
+            style="SAP.Body.TLabel",
             anchor="w",
             justify="left"
         )
         excel_label.pack(fill=tk.X, pady=(0, 5))
         
         # Botón de Excel
-        excel_button = tk.Button(
-            excel_frame, 
-            text="Seleccionar o Crear Excel",
-            command=self.choose_excel_file,
-            bg=SAP_COLORS["success"],
-            fg="#FFFFFF",
-            activebackground="#085E2E",
-            activeforeground="#FFFFFF",
-            font=("Arial", 10, "bold"),
-            padx=10, pady=5
-        )
+        excel_button = self._create_action_button(excel_frame, "Seleccionar o Crear Excel", self.choose_excel_file, "Success.TButton")
         excel_button.pack(fill=tk.X, pady=5)
         
         # Mostrar el nombre del archivo seleccionado
-        self.excel_filename_var = tk.StringVar(value="No seleccionado")
-        excel_file_label = tk.Label(
+        excel_file_label = ttk.Label(
             excel_frame, 
             textvariable=self.excel_filename_var,
-            bg=SAP_COLORS["light"],
-            fg="#0A3D6E",
-            font=("Arial", 9, "bold"),
+            style="SAP.File.TLabel",
             wraplength=200,
             anchor="w",
             justify="left"
         )
         excel_file_label.pack(fill=tk.X, pady=5)
-        
+
+    def _build_action_section(self):
+        """Construye la sección de acciones del panel izquierdo"""
         # Sección de acción
-        action_frame = tk.LabelFrame(self.left_panel, 
-                                text="Acciones", 
-                                bg=SAP_COLORS["light"],
-                                fg="#000000",
-                                font=("Arial", 11, "bold"),
-                                padx=10, pady=10)
+        action_frame = ttk.LabelFrame(self.left_panel, text="Acciones", style="SAP.TLabelframe", padding=10)
         action_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Etiqueta de acción
-        action_label = tk.Label(
+        action_label = ttk.Label(
             action_frame, 
             text="Extraer datos de issues desde SAP:",
-            bg=SAP_COLORS["light"],
-            fg="#000000",
-            font=("Arial", 10),
+            style="SAP.Body.TLabel",
             anchor="w",
             justify="left"
         )
         action_label.pack(fill=tk.X, pady=(0, 5))
         
         # Botón de extracción
-        extract_button = tk.Button(
-            action_frame, 
-            text="Iniciar Extracción de Issues",
-            command=self.start_extraction,
-            bg=SAP_COLORS["warning"],
-            fg="#FFFFFF",
-            activebackground="#C25A00",
-            activeforeground="#FFFFFF",
-            font=("Arial", 10, "bold"),
-            padx=10, pady=5
-        )
+        extract_button = self._create_action_button(action_frame, "Iniciar Extracción de Issues", self.start_extraction, "Warning.TButton")
         extract_button.pack(fill=tk.X, pady=5)
         
         # Separador visual
@@ -2344,137 +3814,105 @@ class IssuesExtractor:
         separator.pack(fill=tk.X, pady=10)
         
         # Botón de salir
-        exit_button = tk.Button(
-            action_frame, 
-            text="Salir de la Aplicación",
-            command=self.exit_app,
-            bg=SAP_COLORS["danger"],
-            fg="#FFFFFF",
-            activebackground="#990000",
-            activeforeground="#FFFFFF",
-            font=("Arial", 10, "bold"),
-            padx=10, pady=5
-        )
+        exit_button = self._create_action_button(action_frame, "Salir de la Aplicación", self.exit_app, "Danger.TButton")
         exit_button.pack(fill=tk.X, pady=5)
-        
-        # Panel derecho para logs
-        right_panel = ttk.Frame(content_frame, padding=10, width=300)
-        right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
-        right_panel.pack_propagate(False)
-        
-        # Log frame
-        log_frame = tk.LabelFrame(right_panel, 
-                            text="Registro de Actividad", 
-                            bg=SAP_COLORS["light"],
-                            fg="#000000",
-                            font=("Arial", 11, "bold"))
-        log_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Text widget para logs
-        self.log_text = tk.Text(
-            log_frame, 
-            height=20, 
-            wrap=tk.WORD, 
-            bg="white",
-            fg="black",
-            font=("Consolas", 9),
-            padx=5,
-            pady=5,
-            borderwidth=2,
-            relief=tk.SUNKEN
-        )
-        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # Colores para los logs
-        self.log_text.tag_configure("INFO", foreground="black")
-        self.log_text.tag_configure("WARNING", foreground="#CC6600")
-        self.log_text.tag_configure("ERROR", foreground="#990000")
-        self.log_text.tag_configure("DEBUG", foreground="#555555")
-        
-        # Scrollbar para el log
-        scrollbar = ttk.Scrollbar(log_frame, command=self.log_text.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.log_text.config(yscrollcommand=scrollbar.set)
-        
-        # Status bar
-        self.status_var = tk.StringVar(value="Listo para iniciar")
-        status_bar = tk.Label(
-            self.root, 
-            textvariable=self.status_var,
-            fg="#000000",
-            bg="#F0F0F0",
-            relief=tk.SUNKEN, 
-            anchor=tk.W, 
-            padx=5,
-            pady=2,
-            font=("Arial", 10)
-        )
-        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
-        
-        # Configurar logger para que también escriba en la GUI
-        self.setup_gui_logger()
-        
-        # Manejar cierre de ventana
-        self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
-        
-        # Centrar la ventana en la pantalla
-        self.root.update_idletasks()
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
-        size = tuple(int(_) for _ in self.root.geometry().split('+')[0].split('x'))
-        x = screen_width/2 - size[0]/2
-        y = screen_height/2 - size[1]/2
-        self.root.geometry("%dx%d+%d+%d" % (size + (x, y)))
-        
-        # Cargar configuración guardada
-        self.load_config()
-        
-
-
-
-
 
+    def _create_action_button(self, parent, text, command, button_style):
+        """Crea un botón de acción con uno de los estilos ttk de la ventana principal"""
+        return ttk.Button(parent, text=text, command=command, style=button_style)
+    
+    def _build_section(self, name):
+        """Construye una sección diferida del panel izquierdo si aún no existe"""
+        if name not in self._built_sections:
+            self._built_sections.add(name)
+            self._section_builders[name]()
+    
+    def _build_pending_sections(self):
+        """Construye, en orden, las secciones diferidas que aún no se han construido"""
+        for name in self._section_builders:
+            self._build_section(name)
+    
+    def _on_client_selected(self, event=None):
+        """Asegura que exista la sección de proyecto antes de aplicar el cliente seleccionado"""
+        self._build_section("project")
+        self.select_client(self.client_combo.get())
+    
     def setup_gui_logger(self):
         """Configura el logger para que también escriba en la GUI"""
         class TextHandler(logging.Handler):
+            MAX_LINES = 1000  # Líneas máximas que se conservan en el widget
+            DRAIN_INTERVAL_MS = 50  # Intervalo entre volcados de registros pendientes al widget
+            MAX_BATCH = 500  # Registros máximos que se insertan en cada volcado
+            MAX_QUEUED = 5000  # Registros pendientes máximos; los que no caben se descartan
+            
             def __init__(self, text_widget):
                 logging.Handler.__init__(self)
                 self.text_widget = text_widget
+                self.line_count = 0
+                self.records = queue.Queue(maxsize=self.MAX_QUEUED)
+                self.dropped = 0  # Registros descartados con la cola llena
+                self.text_widget.after(self.DRAIN_INTERVAL_MS, self.drain)
             
             def emit(self, record):
-                msg = self.format(record)
-                def append():
-                    self.text_widget.configure(state='normal')
-                    
-                    # Agregar marca de tiempo y nivel con color
-                    time_str = msg.split(' - ')[0] + ' - '
-                    level_str = record.levelname + ' - '
-                    msg_content = msg.split(' - ', 2)[2] if len(msg.split(' - ')) > 2 else ""
-                    
-                    self.text_widget.insert(tk.END, time_str, "INFO")
-                    self.text_widget.insert(tk.END, level_str, record.levelname)
-                    self.text_widget.insert(tk.END, msg_content + '\n', record.levelname)
-                    
-                    self.text_widget.configure(state='disabled')
-                    self.text_widget.yview(tk.END)
+                # Solo encolar: el widget se actualiza por lotes desde el hilo principal en drain().
+                # Se toman las partes del registro directamente en lugar de formatear y volver a separar
+                # La cola está acotada para no crecer sin límite si el bucle de Tk está ocupado
+                try:
+                    self.records.put_nowait((self.formatter.formatTime(record), record.levelname, record.getMessage()))
+                except queue.Full:
+                    self.dropped += 1
+                
+            def drain(self):
+                """Inserta en el widget todos los registros pendientes con una sola llamada a Tk"""
+                segments = []
+                try:
+                    while len(segments) < self.MAX_BATCH * 6:
+                        time_str, levelname, msg_content = self.records.get_nowait()
+                        
+                        # Agregar marca de tiempo y nivel con color
+                        segments += [time_str + ' - ', "INFO", levelname + ' - ', levelname, msg_content + '\n', levelname]
+                        self.line_count += msg_content.count('\n') + 1
+                except queue.Empty:
+                    pass
                     
-                    # Limitar tamaño del log
-                    self.limit_log_length()
+                # emit() se ejecuta con el bloqueo del handler: se lee y reinicia el contador con él
+                self.acquire()
+                try:
+                    dropped, self.dropped = self.dropped, 0
+                finally:
+                    self.release()
+                if dropped:
+                    segments += [f"... {dropped} mensajes omitidos (cola de log llena)\n", "WARNING"]
+                    self.line_count += 1
                     
-                # Llamar a append desde el hilo principal
-                self.text_widget.after(0, append)
+                try:
+                    if segments:
+                        self.text_widget.configure(state='normal')
+                        self.text_widget.insert(tk.END, *segments)
+                        self.text_widget.configure(state='disabled')
+                        self.text_widget.yview(tk.END)
+                        
+                        # Limitar tamaño del log
+                        self.limit_log_length()
+                        
+                    self.text_widget.after(self.DRAIN_INTERVAL_MS, self.drain)
+                except tk.TclError:
+                    # El widget ya se destruyó al cerrar la aplicación
+                    pass
                 
             def limit_log_length(self):
-                """Limita la longitud del log para evitar consumo excesivo de memoria"""
-                if float(self.text_widget.index('end-1c').split('.')[0]) > 1000:
+                """Limita la longitud del log eliminando las líneas más antiguas que superen el máximo"""
+                excess = self.line_count - self.MAX_LINES
+                if excess > 0:
                     self.text_widget.configure(state='normal')
-                    self.text_widget.delete('1.0', '500.0')
+                    self.text_widget.delete('1.0', f'{excess + 1}.0')
                     self.text_widget.configure(state='disabled')
+                    self.line_count -= excess
         
         # Crear handler para el widget Text
         text_handler = TextHandler(self.log_text)
         text_handler.setLevel(logging.INFO)
-        text_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        text_handler.setFormatter(LOG_FORMATTER)
         
         # Añadir el handler al logger
         logger.addHandler(text_handler)
@@ -2486,30 +3924,44 @@ class IssuesExtractor:
         """Maneja la selección de un cliente desde el combobox"""
         try:
             # Extraer el ERP number del string "1025541 - Nombre del cliente"
-            erp_number = client_string.split(" - ")[0]
+            erp_number = client_string.partition(" - ")[0]
             self.client_var.set(erp_number)
             
-            # Actualizar la lista de proyectos para este cliente
+            # Consultar la base de datos en segundo plano para no bloquear la interfaz
+            threading.Thread(target=self._load_projects_async, args=(erp_number,), daemon=True).start()
+            
+            logger.info(f"Cliente seleccionado: {client_string}")
+            self.save_config()
+        except Exception as e:
+            logger.error(f"Error al seleccionar cliente: {e}")
+    
+    def _load_projects_async(self, erp_number):
+        """Obtiene los proyectos del cliente en un hilo y los aplica desde el hilo principal"""
+        try:
             projects = self.db_manager.get_projects(erp_number)
-            self.project_combo['values'] = projects
             
-            if projects:
-                self.project_combo.current(0)
-                self.select_project(projects[0])
-                
             # Actualizar el uso de este cliente
             self.db_manager.update_client_usage(erp_number)
             
-            logger.info(f"Cliente seleccionado: {client_string}")
-            self.save_config()
+            self.root.after(0, lambda: self._apply_client_projects(erp_number, projects))
         except Exception as e:
-            logger.error(f"Error al seleccionar cliente: {e}")
+            logger.error(f"Error al cargar proyectos del cliente {erp_number}: {e}")
+    
+    def _apply_client_projects(self, erp_number, projects):
+        """Actualiza la lista de proyectos si el cliente sigue seleccionado"""
+        if self.client_var.get() != erp_number:
+            return
+            
+        self.project_combo['values'] = projects
+        if projects:
+            self.project_combo.current(0)
+            self.select_project(projects[0])
     
     def select_project(self, project_string):
         """Maneja la selección de un proyecto desde el combobox"""
         try:
             # Extraer el ID del proyecto del string "20096444 - Nombre del proyecto"
-            project_id = project_string.split(" - ")[0]
+            project_id = project_string.partition(" - ")[0]
             self.project_var.set(project_id)
             
             # Actualizar el uso de este proyecto
@@ -2536,7 +3988,7 @@ class IssuesExtractor:
             # Actualizar la interfaz para mostrar que se está iniciando el navegador
             self.status_var.set("Iniciando navegador...")
             if self.root:
-                self.root.update()
+                self.root.update_idletasks()
             
             # Iniciar el navegador en un hilo separado
             threading.Thread(target=self._start_browser_thread, daemon=True).start()
@@ -2640,8 +4092,9 @@ class IssuesExtractor:
                 except:
                     logger.warning("No se pudo cerrar el navegador correctamente")
             
-            # Guardar configuración antes de salir
-            self.save_config()
+            # Guardar configuración antes de salir (sin esperar al guardado programado)
+            self._write_config()
+            self.db_manager.close()
             
             self.root.destroy()
         except Exception as e:
@@ -2650,29 +4103,46 @@ class IssuesExtractor:
             self.root.destroy()
     
     def save_config(self):
-        """Guarda la configuración actual"""
+        """Programa el guardado de la configuración, agrupando las llamadas seguidas"""
+        if not self.root:
+            self._write_config()
+            return
+            
+        if self._save_config_after:
+            self.root.after_cancel(self._save_config_after)
+        self._save_config_after = self.root.after(self.CONFIG_SAVE_DELAY_MS, self._write_config)
+    
+    def _write_config(self):
+        """Escribe la configuración actual en disco de forma atómica"""
+        if self._save_config_after:
+            # Si se llama directamente (al salir), el guardado programado ya no hace falta
+            self.root.after_cancel(self._save_config_after)
+            self._save_config_after = None
+            
         try:
-            config = {
+            config_json = json.dumps({
                 'client': self.client_var.get(),
                 'project': self.project_var.get(),
                 'excel_path': self.excel_file_path
-            }
+            })
             
-            config_dir = "config"
-            if not os.path.exists(config_dir):
-                os.makedirs(config_dir)
+            # No reescribir el archivo si la configuración no cambió desde el último guardado
+            if config_json == self._last_config_json:
+                return
                 
-            config_path = os.path.join(config_dir, 'config.json')
-            
-            with open(config_path, 'w') as f:
-                json.dump(config, f)
+            # Escribir en un archivo temporal y reemplazar, para no dejar nunca un JSON a medias
+            tmp_path = self.config_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                f.write(config_json)
+            os.replace(tmp_path, self.config_path)
+            self._last_config_json = config_json
         except Exception as e:
             logger.error(f"Error al guardar configuración: {e}")
     
     def load_config(self):
         """Carga la configuración guardada"""
         try:
-            config_path = os.path.join('config', 'config.json')
+            config_path = self.config_path
             
             if os.path.exists(config_path):
                 with open(config_path, 'r') as f:
@@ -2714,9 +4184,8 @@ def check_required_packages():
     
     missing = []
     for package, description in required_packages.items():
-        try:
-            __import__(package)
-        except ImportError:
+        # find_spec comprueba que el paquete existe sin importarlo ni ejecutar su código
+        if importlib.util.find_spec(package) is None:
             missing.append(f"{package} ({description})")
     
     return missing
@@ -2725,8 +4194,9 @@ def create_shortcut(target_path, shortcut_path=None, icon_path=None):
     """Crea un acceso directo para la aplicación"""
     try:
         if not shortcut_path:
-            desktop_path = os.path.join(os.environ['USERPROFILE'], 'Desktop')
-            shortcut_path = os.path.join(desktop_path, "SAP Issues Extractor.lnk")
+            if DESKTOP_PATH is None:
+                raise KeyError('USERPROFILE')
+            shortcut_path = os.path.join(DESKTOP_PATH, "SAP Issues Extractor.lnk")
             
         if os.path.exists(shortcut_path):
             return shortcut_path
@@ -2763,10 +4233,8 @@ def main():
             input("\nPresiona ENTER para salir...")
             sys.exit(1)
         
-        # Notificar sobre Pillow, pero no detener la ejecución
-        try:
-            __import__("PIL")
-        except ImportError:
+        # Notificar sobre Pillow, pero no detener la ejecución (ya se intentó importar al cargar el módulo)
+        if not PIL_AVAILABLE:
             print("Nota: La biblioteca Pillow no está disponible. Algunas características visuales estarán limitadas.")
             print("Si deseas instalarla, ejecuta: pip install Pillow")
         
@@ -2795,4 +4263,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Necesario para que los procesos de trabajo arranquen en el ejecutable empaquetado de Windows
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file